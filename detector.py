@@ -5,8 +5,13 @@ Analyzes exceptions and service behavior to classify errors by severity
 and determine appropriate recovery strategies.
 """
 
+import logging
+import sys
+from collections import Counter, defaultdict, deque
+from itertools import filterfalse, islice
+from typing import Dict, Iterable, List, Tuple
+
 from core.errors import (
-    ServiceError,
     ErrorSeverity,
     TransientError,
     RecoverableError,
@@ -17,6 +22,26 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Severities checked on every classification, bound once at import.
+_SEV_TRANSIENT = ErrorSeverity.TRANSIENT
+_SEV_RECOVERABLE = ErrorSeverity.RECOVERABLE
+_SEV_CRITICAL = ErrorSeverity.CRITICAL
+
+# Severity of exceptions that do not carry one, by class.  Subclasses map
+# through their MRO, so e.g. ConnectionRefusedError inherits TRANSIENT.
+_SEV_BY_TYPE: Dict[type, ErrorSeverity] = {
+    TransientError: _SEV_TRANSIENT,
+    CriticalError: _SEV_CRITICAL,
+    RecoverableError: _SEV_RECOVERABLE,
+    TimeoutError: _SEV_TRANSIENT,
+    ConnectionError: _SEV_TRANSIENT,
+    ValueError: _SEV_RECOVERABLE,
+    KeyError: _SEV_RECOVERABLE,
+    AttributeError: _SEV_RECOVERABLE,
+    MemoryError: _SEV_CRITICAL,
+    SystemError: _SEV_CRITICAL,
+}
+
 
 class FaultDetector:
     """
@@ -26,9 +51,30 @@ class FaultDetector:
     the severity of failures and guide recovery strategy selection.
     """
 
+    __slots__ = (
+        "max_history",
+        "pattern_window",
+        "error_history",
+        "_counts",
+        "_recent_errors",
+        "_recent_counts",
+        "_type_cache",
+    )
+
     def __init__(self):
-        self.error_history: list[tuple[str, Exception]] = []
         self.max_history: int = 100
+        self.pattern_window: int = 10
+        # Only service names are kept; holding the exceptions would pin
+        # their tracebacks and frames for the lifetime of the window.
+        self.error_history: deque[str] = deque(maxlen=self.max_history)
+        # Per-service failure counts, maintained incrementally for the full
+        # history and for the short window used by pattern escalation.
+        self._counts: defaultdict[str, int] = defaultdict(int)
+        self._recent_errors: deque[str] = deque(maxlen=self.pattern_window)
+        self._recent_counts: defaultdict[str, int] = defaultdict(int)
+        # Resolved severity per exception class; classification by type is
+        # a pure function of the class, so each class is resolved once.
+        self._type_cache: dict[type, ErrorSeverity] = {}
 
     def classify_error(self, error: Exception, service_name: str) -> ErrorSeverity:
         """
@@ -41,51 +87,88 @@ class FaultDetector:
         Returns:
             ErrorSeverity indicating how to handle the error.
         """
-        self._record_error(service_name, error)
-
-        # If already a ServiceError, use its built-in severity
-        if isinstance(error, ServiceError):
-            severity = error.severity
-        else:
-            severity = self._classify_by_type(error)
+        self._record_error(service_name)
 
         # Pattern-based escalation (repeated failures)
-        severity = self._adjust_for_patterns(service_name, severity)
-
-        logger.info(
-            f"Classified error in '{service_name}'",
-            metadata={
-                "service": service_name,
-                "error_type": type(error).__name__,
-                "severity": severity.value,
-                "message": str(error),
-            },
+        severity = self._adjust_for_patterns(
+            service_name, self._base_severity(error)
         )
+
+        if logger.is_enabled(logging.INFO):
+            logger.info(
+                f"Classified error in '{service_name}'",
+                metadata={
+                    "service": service_name,
+                    "error_type": type(error).__name__,
+                    "severity": severity,
+                    "message": str(error),
+                },
+            )
         return severity
 
+    def classify_batch(
+        self, errors: Iterable[Tuple[str, Exception]]
+    ) -> List[ErrorSeverity]:
+        """
+        Classify a batch of ``(service_name, error)`` pairs in order.
+
+        Equivalent to calling classify_error() for each pair, including
+        pattern-based escalation, but logs one summary line for the whole
+        batch instead of one line per error.
+
+        Returns:
+            The severity of each error, in input order.
+        """
+        record = self._record_error
+        base_severity = self._base_severity
+        adjust = self._adjust_for_patterns
+
+        severities: List[ErrorSeverity] = []
+        for service_name, error in errors:
+            record(service_name)
+            severities.append(adjust(service_name, base_severity(error)))
+
+        if severities and logger.is_enabled(logging.INFO):
+            logger.info(
+                f"Classified batch of {len(severities)} error(s)",
+                metadata={
+                    severity.value: count
+                    for severity, count in Counter(severities).items()
+                },
+            )
+        return severities
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _base_severity(self, error: Exception) -> ErrorSeverity:
+        """Severity of *error* before pattern-based escalation."""
+        # ServiceErrors (and anything else carrying one) bring their own severity
+        severity = getattr(error, "severity", None)
+        if isinstance(severity, ErrorSeverity):
+            return severity
+        return self._classify_by_type(error)
+
     def _classify_by_type(self, error: Exception) -> ErrorSeverity:
-        """Classify error based on exception type hierarchy."""
-        if isinstance(error, TransientError):
-            return ErrorSeverity.TRANSIENT
-        if isinstance(error, CriticalError):
-            return ErrorSeverity.CRITICAL
-        if isinstance(error, RecoverableError):
-            return ErrorSeverity.RECOVERABLE
-
-        # Map built-in exceptions
-        if isinstance(error, (TimeoutError, ConnectionError)):
-            return ErrorSeverity.TRANSIENT
-        if isinstance(error, (ValueError, KeyError, AttributeError)):
-            return ErrorSeverity.RECOVERABLE
-        if isinstance(error, (MemoryError, SystemError)):
-            return ErrorSeverity.CRITICAL
+        """Classify error based on exception type, memoized per class."""
+        error_type = type(error)
+        severity = self._type_cache.get(error_type)
+        if severity is None:
+            severity = self._resolve_type_severity(error_type)
+            self._type_cache[error_type] = severity
+        return severity
+
+    @staticmethod
+    def _resolve_type_severity(error_type: type) -> ErrorSeverity:
+        """Severity of the nearest class in *error_type*'s MRO with a mapping."""
+        for cls in error_type.__mro__:
+            severity = _SEV_BY_TYPE.get(cls)
+            if severity is not None:
+                return severity
 
         # Default: treat unknown errors as recoverable
-        return ErrorSeverity.RECOVERABLE
+        return _SEV_RECOVERABLE
 
     def _adjust_for_patterns(
         self, service_name: str, base_severity: ErrorSeverity
@@ -96,31 +179,55 @@ class FaultDetector:
         A service that keeps throwing 'transient' errors is no longer
         experiencing a transient condition – it needs stronger intervention.
         """
-        recent_failures = sum(
-            1 for svc, _ in self.error_history[-10:] if svc == service_name
-        )
+        recent_failures = self._recent_counts.get(service_name, 0)
 
-        if recent_failures >= 5 and base_severity == ErrorSeverity.TRANSIENT:
+        # Common case: below the lowest escalation threshold.
+        if recent_failures < 5:
+            return base_severity
+
+        if base_severity is _SEV_TRANSIENT:
             logger.warning(
                 f"Escalating severity for '{service_name}': TRANSIENT → RECOVERABLE",
                 metadata={"recent_failures": recent_failures},
             )
-            return ErrorSeverity.RECOVERABLE
+            return _SEV_RECOVERABLE
 
-        if recent_failures >= 8 and base_severity == ErrorSeverity.RECOVERABLE:
+        if recent_failures >= 8 and base_severity is _SEV_RECOVERABLE:
             logger.error(
                 f"Escalating severity for '{service_name}': RECOVERABLE → CRITICAL",
                 metadata={"recent_failures": recent_failures},
             )
-            return ErrorSeverity.CRITICAL
+            return _SEV_CRITICAL
 
         return base_severity
 
-    def _record_error(self, service_name: str, error: Exception) -> None:
-        """Record error in sliding-window history."""
-        self.error_history.append((service_name, error))
-        if len(self.error_history) > self.max_history:
-            self.error_history = self.error_history[-self.max_history:]
+    def _record_error(self, service_name: str) -> None:
+        """Record error in sliding-window history and update failure counts."""
+        # Interned names let the history and counter lookups compare by
+        # identity, and every entry for a service shares one string object.
+        service_name = sys.intern(service_name)
+
+        if len(self.error_history) == self.max_history:
+            self._discount(self._counts, self.error_history[0])
+        self.error_history.append(service_name)
+        self._counts[service_name] += 1
+
+        if len(self._recent_errors) == self.pattern_window:
+            self._discount(self._recent_counts, self._recent_errors[0])
+        self._recent_errors.append(service_name)
+        self._recent_counts[service_name] += 1
+
+    @staticmethod
+    def _discount(counts: defaultdict, service_name: str) -> None:
+        """Decrement a failure count for an entry leaving its window."""
+        counts[service_name] -= 1
+        if not counts[service_name]:
+            del counts[service_name]
+
+    def _recent(self, window: int):
+        """Iterate over the last *window* entries of the error history."""
+        size = len(self.error_history)
+        return islice(self.error_history, max(0, size - window), size)
 
     # ------------------------------------------------------------------
     # Public utilities
@@ -128,13 +235,33 @@ class FaultDetector:
 
     def get_failure_count(self, service_name: str, window: int = 10) -> int:
         """Return the number of recent failures for a service within *window*."""
+        if window == self.pattern_window:
+            return self._recent_counts.get(service_name, 0)
+        if window >= self.max_history:
+            return self._counts.get(service_name, 0)
         return sum(
-            1 for svc, _ in self.error_history[-window:] if svc == service_name
+            1 for svc in self._recent(window) if svc == service_name
         )
 
+    def recent_window(self) -> Tuple[str, ...]:
+        """
+        Return the service names in the pattern window, oldest first.
+
+        Once the window holds ``pattern_window`` entries, the next recorded
+        error pushes out the first one.
+        """
+        return tuple(self._recent_errors)
+
     def clear_history(self, service_name: str) -> None:
         """Clear error history for a specific service."""
-        self.error_history = [
-            (svc, err) for svc, err in self.error_history if svc != service_name
-        ]
+        self.error_history = deque(
+            filterfalse(service_name.__eq__, self.error_history),
+            maxlen=self.max_history,
+        )
+        self._counts.pop(service_name, None)
+
+        # The short window is the tail of what remains, not just the
+        # survivors of the old window.
+        self._recent_errors = deque(self.error_history, maxlen=self.pattern_window)
+        self._recent_counts = defaultdict(int, Counter(self._recent_errors))
         logger.info(f"Cleared error history for '{service_name}'")
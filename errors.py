@@ -9,12 +9,20 @@ from enum import Enum
 from typing import Optional
 
 
-class ErrorSeverity(Enum):
-    """Severity levels for error classification."""
+class ErrorSeverity(str, Enum):
+    """
+    Severity levels for error classification.
+
+    Members are strings, so they compare equal to and serialize as their
+    values without going through ``.value``.
+    """
     TRANSIENT = "transient"      # Temporary, likely to resolve on retry
     RECOVERABLE = "recoverable"  # Requires intervention but recoverable
     CRITICAL = "critical"        # Non-recoverable, requires manual intervention
 
+    def __str__(self) -> str:
+        return self.value
+
 
 class ServiceError(Exception):
     """Base exception for all service errors."""
@@ -31,7 +39,7 @@ class ServiceError(Exception):
         self.metadata = metadata or {}
 
     def __str__(self) -> str:
-        return f"[{self.severity.value.upper()}] {self.message}"
+        return f"[{self.severity.upper()}] {self.message}"
 
 
 class TransientError(ServiceError):
@@ -4,9 +4,11 @@ Health reporting and status dashboard.
 Provides a consolidated view of system health across all monitored services.
 """
 
-from datetime import datetime
+import io
+import time
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from core.service import ServiceState
 from utils.logger import get_logger
@@ -14,13 +16,26 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# States compared against on every report, bound once at import.  Statuses
+# from ServiceMonitor carry the enum members themselves, so these checks
+# resolve by identity; plain value strings still compare equal.
+_DEGRADED = ServiceState.DEGRADED
+_FAILED_STATES = frozenset((ServiceState.FAILING, ServiceState.STOPPED_WITH_ERROR))
 
-class SystemHealth(Enum):
+_SEPARATOR = "=" * 60
+_ALERT_LINE = "  [{}] {}"
+_SERVICE_LINE = "  {} {}: {}  (recent failures: {})"
+
+
+class SystemHealth(str, Enum):
     """Overall system health status."""
     HEALTHY = "healthy"    # All services running normally
     DEGRADED = "degraded"  # Some services degraded but operational
     CRITICAL = "critical"  # One or more services have failed
 
+    def __str__(self) -> str:
+        return self.value
+
 
 class HealthReporter:
     """
@@ -28,10 +43,20 @@ class HealthReporter:
 
     Aggregates per-service status information into a system-wide view
     including alerts, summary metrics, and an overall health signal.
+
+    Args:
+        stream_threshold: Service count above which format_report_text
+                          streams into a buffer instead of joining lines.
     """
 
-    def __init__(self):
-        self.last_report_time: datetime = datetime.utcnow()
+    __slots__ = ("stream_threshold", "last_report_time", "_ts_cache")
+
+    def __init__(self, stream_threshold: int = 1000):
+        self.stream_threshold = stream_threshold
+        self.last_report_time: datetime = datetime.now(timezone.utc)
+        # (epoch second, datetime, ISO string) of the last report timestamp,
+        # so bursts of reports within one second format it only once.
+        self._ts_cache: Tuple[int, datetime, str] = (0, self.last_report_time, "")
 
     # ------------------------------------------------------------------
     # Report generation
@@ -47,20 +72,11 @@ class HealthReporter:
         Returns:
             Report dict with system_health, summary, alerts, and per-service details.
         """
-        report_time = datetime.utcnow()
+        report_time, timestamp = self._report_timestamp()
 
         total = len(service_statuses)
-        healthy_count = sum(1 for s in service_statuses.values() if s.get("healthy"))
-        degraded_count = sum(
-            1 for s in service_statuses.values()
-            if s.get("state") == ServiceState.DEGRADED.value
-        )
-        failed_count = sum(
-            1 for s in service_statuses.values()
-            if s.get("state") in (
-                ServiceState.FAILING.value,
-                ServiceState.STOPPED_WITH_ERROR.value,
-            )
+        healthy_count, degraded_count, failed_count, alerts = self._summarize(
+            service_statuses
         )
 
         system_health = self._determine_system_health(
@@ -68,8 +84,8 @@ class HealthReporter:
         )
 
         report = {
-            "timestamp": report_time.isoformat(),
-            "system_health": system_health.value,
+            "timestamp": timestamp,
+            "system_health": system_health,
             "summary": {
                 "total_services": total,
                 "healthy": healthy_count,
@@ -78,7 +94,7 @@ class HealthReporter:
                 "health_percentage": (healthy_count / total * 100) if total > 0 else 0.0,
             },
             "services": service_statuses,
-            "alerts": self._generate_alerts(service_statuses),
+            "alerts": alerts,
         }
 
         self.last_report_time = report_time
@@ -89,21 +105,78 @@ class HealthReporter:
     # ------------------------------------------------------------------
 
     def format_report_text(self, report: Dict) -> str:
-        """Render a health report as human-readable text."""
-        lines: List[str] = []
-        sep = "=" * 60
+        """
+        Render a health report as human-readable text.
+
+        Reports with more than stream_threshold services are written
+        straight into a text buffer rather than collected as a line list.
+        """
+        if len(report["services"]) > self.stream_threshold:
+            return self._format_report_stream(report)
+
+        lines = self._report_header_lines(report)
+
+        if report["alerts"]:
+            lines.append("ALERTS:")
+            lines.extend([
+                _ALERT_LINE.format(alert["severity"].upper(), alert["message"])
+                for alert in report["alerts"]
+            ])
+            lines.append("")
+
+        lines.append("SERVICES:")
+        lines.extend([
+            _SERVICE_LINE.format(
+                "✓" if status.get("healthy") else "✗",
+                name,
+                status.get("state", "unknown"),
+                status.get("recent_failures", 0),
+            )
+            for name, status in report["services"].items()
+        ])
+
+        lines.append(_SEPARATOR)
+        return "\n".join(lines)
+
+    def _format_report_stream(self, report: Dict) -> str:
+        """Render a large report without materializing a list of lines."""
+        buf = io.StringIO()
+        write = buf.write
+
+        for line in self._report_header_lines(report):
+            write(line)
+            write("\n")
+
+        if report["alerts"]:
+            write("ALERTS:\n")
+            for alert in report["alerts"]:
+                write(_ALERT_LINE.format(alert["severity"].upper(), alert["message"]))
+                write("\n")
+            write("\n")
 
-        lines += [
-            sep,
+        write("SERVICES:\n")
+        for name, status in report["services"].items():
+            write(_SERVICE_LINE.format(
+                "✓" if status.get("healthy") else "✗",
+                name,
+                status.get("state", "unknown"),
+                status.get("recent_failures", 0),
+            ))
+            write("\n")
+
+        write(_SEPARATOR)
+        return buf.getvalue()
+
+    def _report_header_lines(self, report: Dict) -> List[str]:
+        """Title and summary block shared by both rendering paths."""
+        s = report["summary"]
+        return [
+            _SEPARATOR,
             "SYSTEM HEALTH REPORT",
-            sep,
+            _SEPARATOR,
             f"Timestamp:     {report['timestamp']}",
             f"System Health: {report['system_health'].upper()}",
             "",
-        ]
-
-        s = report["summary"]
-        lines += [
             "SUMMARY:",
             f"  Total Services : {s['total_services']}",
             f"  Healthy        : {s['healthy']}",
@@ -113,26 +186,18 @@ class HealthReporter:
             "",
         ]
 
-        if report["alerts"]:
-            lines.append("ALERTS:")
-            for alert in report["alerts"]:
-                lines.append(f"  [{alert['severity'].upper()}] {alert['message']}")
-            lines.append("")
-
-        lines.append("SERVICES:")
-        for name, status in report["services"].items():
-            icon = "✓" if status.get("healthy") else "✗"
-            state = status.get("state", "unknown")
-            failures = status.get("recent_failures", 0)
-            lines.append(f"  {icon} {name}: {state}  (recent failures: {failures})")
-
-        lines.append(sep)
-        return "\n".join(lines)
-
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _report_timestamp(self) -> Tuple[datetime, str]:
+        """Return the current UTC time at one-second resolution and its ISO form."""
+        second = int(time.time())
+        if second != self._ts_cache[0]:
+            moment = datetime.fromtimestamp(second, timezone.utc)
+            self._ts_cache = (second, moment, moment.isoformat())
+        return self._ts_cache[1], self._ts_cache[2]
+
     def _determine_system_health(
         self, total: int, healthy: int, degraded: int, failed: int
     ) -> SystemHealth:
@@ -145,19 +210,38 @@ class HealthReporter:
         return SystemHealth.HEALTHY
 
     def _generate_alerts(self, service_statuses: Dict[str, Dict]) -> List[Dict]:
+        return self._summarize(service_statuses)[3]
+
+    def _summarize(
+        self, service_statuses: Dict[str, Dict]
+    ) -> Tuple[int, int, int, List[Dict]]:
+        """
+        Count healthy / degraded / failed services and collect alerts.
+
+        Done in a single pass over *service_statuses*.
+
+        Returns:
+            (healthy_count, degraded_count, failed_count, alerts)
+        """
+        healthy_count = degraded_count = failed_count = 0
         alerts: List[Dict] = []
 
         for name, status in service_statuses.items():
+            if status.get("healthy"):
+                healthy_count += 1
+
             state = status.get("state", "")
 
-            if state in (ServiceState.FAILING.value, ServiceState.STOPPED_WITH_ERROR.value):
+            if state in _FAILED_STATES:
+                failed_count += 1
                 alerts.append({
                     "severity": "critical",
                     "service": name,
                     "message": f"Service '{name}' has failed (state={state})",
                     "state": state,
                 })
-            elif state == ServiceState.DEGRADED.value:
+            elif state == _DEGRADED:
+                degraded_count += 1
                 alerts.append({
                     "severity": "warning",
                     "service": name,
@@ -174,4 +258,4 @@ class HealthReporter:
                     "failure_count": failure_count,
                 })
 
-        return alerts
+        return healthy_count, degraded_count, failed_count, alerts
@@ -2,14 +2,50 @@
 Structured logging utilities for the self-healing framework.
 
 Provides consistent, structured logging with different severity levels
-and optional JSON metadata attachment.
+and optional JSON metadata attachment.  Metadata is encoded with orjson
+when it is installed, and with the standard library json module otherwise
+(or when orjson rejects a value); both render the same compact JSON.
 """
 
 import json
 import logging
 import sys
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+
+def _json_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:  # orjson.JSONEncodeError, e.g. ints over 64 bits
+            return _json_dumps(obj)
+
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    _dumps = _json_dumps
+
+
+class _JsonArg:
+    """
+    Log-record argument that JSON-encodes metadata only when rendered.
+
+    Encoding is deferred to the moment a handler formats the record, and
+    works with any Formatter, including handlers reached by propagation.
+    """
+
+    __slots__ = ("metadata",)
+
+    def __init__(self, metadata: Dict[str, Any]):
+        self.metadata = metadata
+
+    def __str__(self) -> str:
+        return _dumps(self.metadata)
 
 
 class StructuredLogger:
@@ -20,6 +56,8 @@ class StructuredLogger:
         {timestamp} | {LEVEL} | {name} | {message} [ | Metadata: {json} ]
     """
 
+    __slots__ = ("_logger",)
+
     def __init__(self, name: str, level: int = logging.INFO):
         self._logger = logging.getLogger(name)
         self._logger.setLevel(level)
@@ -40,37 +78,64 @@ class StructuredLogger:
     # ------------------------------------------------------------------
 
     def debug(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        self._emit(logging.DEBUG, message, metadata)
+        if metadata:
+            self._emit(logging.DEBUG, message, metadata)
+        else:
+            self._logger.debug(message)
 
     def info(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        self._emit(logging.INFO, message, metadata)
+        if metadata:
+            self._emit(logging.INFO, message, metadata)
+        else:
+            self._logger.info(message)
 
     def warning(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        self._emit(logging.WARNING, message, metadata)
+        if metadata:
+            self._emit(logging.WARNING, message, metadata)
+        else:
+            self._logger.warning(message)
 
     def error(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        self._emit(logging.ERROR, message, metadata)
+        if metadata:
+            self._emit(logging.ERROR, message, metadata)
+        else:
+            self._logger.error(message)
 
     def critical(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        self._emit(logging.CRITICAL, message, metadata)
+        if metadata:
+            self._emit(logging.CRITICAL, message, metadata)
+        else:
+            self._logger.critical(message)
+
+    def is_enabled(self, level: int) -> bool:
+        """Return True if a record at *level* would be emitted.
+
+        Lets hot call sites skip building messages and metadata that
+        would be discarded anyway.
+        """
+        return self._logger.isEnabledFor(level)
 
     # ------------------------------------------------------------------
     # Private helper
     # ------------------------------------------------------------------
 
-    def _emit(
-        self, level: int, message: str, metadata: Optional[Dict[str, Any]]
-    ) -> None:
-        if metadata:
-            self._logger.log(level, f"{message} | Metadata: {json.dumps(metadata)}")
-        else:
-            self._logger.log(level, message)
+    def _emit(self, level: int, message: str, metadata: Dict[str, Any]) -> None:
+        # Only reached with metadata; skip the record when *level* is disabled.
+        if not self._logger.isEnabledFor(level):
+            return
+        self._logger.log(level, "%s | Metadata: %s", message, _JsonArg(metadata))
+
+
+_LOGGER_CACHE: Dict[Tuple[str, int], StructuredLogger] = {}
 
 
 def get_logger(name: str, level: int = logging.INFO) -> StructuredLogger:
     """
     Factory function to create a StructuredLogger.
 
+    Instances are cached per (name, level), so repeated calls reuse the
+    same logger instead of rebuilding its handler.
+
     Args:
         name:  Logger name (typically __name__).
         level: Logging level (default: INFO).
@@ -78,4 +143,9 @@ def get_logger(name: str, level: int = logging.INFO) -> StructuredLogger:
     Returns:
         Configured StructuredLogger instance.
     """
-    return StructuredLogger(name, level)
+    key = (name, level)
+    instance = _LOGGER_CACHE.get(key)
+    if instance is None:
+        instance = StructuredLogger(name, level)
+        _LOGGER_CACHE[key] = instance
+    return instance
@@ -5,11 +5,15 @@ Runs five demonstration scenarios that progressively exercise
 transient, recoverable, critical, and mixed failure patterns.
 """
 
+import os
 import sys
 import time
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
 
 from core.monitor import ServiceMonitor
 from core.health import HealthReporter
+from core.service import ManagedService
 from services.sample_service import (
     StableService,
     TransientFailureService,
@@ -24,6 +28,31 @@ logger = get_logger(__name__)
 
 DIVIDER = "=" * 70
 
+# Scales every pause in the demos; set SHF_DEMO_SLEEP=0 to run them
+# back-to-back (e.g. under a profiler).
+DEMO_SLEEP = float(os.environ.get("SHF_DEMO_SLEEP", "1.0"))
+
+
+@contextmanager
+def make_env(
+    services: List[ManagedService],
+) -> Iterator[Tuple[ServiceMonitor, HealthReporter]]:
+    """
+    Set up a monitor and reporter with *services* registered and started.
+
+    Every service is stopped again when the block exits, even on error.
+    """
+    monitor = ServiceMonitor()
+    reporter = HealthReporter()
+
+    monitor.register_services(services)
+
+    try:
+        yield monitor, reporter
+    finally:
+        for svc in services:
+            monitor.stop_service(svc.name)
+
 
 # ======================================================================
 # Individual demo scenarios
@@ -35,21 +64,14 @@ def demo_basic_monitoring() -> None:
     print("DEMO 1: Basic Service Monitoring (Stable Service)")
     print(f"{DIVIDER}\n")
 
-    monitor = ServiceMonitor()
-    reporter = HealthReporter()
-
-    svc = StableService("BasicService")
-    monitor.register_service(svc)
-    monitor.start_service("BasicService")
-
-    for _ in range(3):
-        result = monitor.execute_with_monitoring("BasicService")
-        print(f"  ✓  {result}")
-        time.sleep(0.5)
+    with make_env([StableService("BasicService")]) as (monitor, reporter):
+        for _ in range(3):
+            result = monitor.execute_with_monitoring("BasicService")
+            print(f"  ✓  {result}")
+            time.sleep(0.5 * DEMO_SLEEP)
 
-    report = reporter.generate_report(monitor.get_all_service_status())
-    print("\n" + reporter.format_report_text(report))
-    monitor.stop_service("BasicService")
+        report = reporter.generate_report(monitor.get_all_service_status())
+        print("\n" + reporter.format_report_text(report))
 
 
 def demo_transient_failures() -> None:
@@ -58,24 +80,18 @@ def demo_transient_failures() -> None:
     print("DEMO 2: Transient Failure Recovery  (Retry Strategy)")
     print(f"{DIVIDER}\n")
 
-    monitor = ServiceMonitor()
-    reporter = HealthReporter()
-
     svc = TransientFailureService("TransientService", failure_rate=0.3)
-    monitor.register_service(svc)
-    monitor.start_service("TransientService")
-
-    print("  Service has a 30% failure rate — watch automatic retries...\n")
+    with make_env([svc]) as (monitor, reporter):
+        print("  Service has a 30% failure rate — watch automatic retries...\n")
 
-    for _ in range(5):
-        result = monitor.execute_with_monitoring("TransientService")
-        if result:
-            print(f"  ✓  {result}")
-        time.sleep(0.3)
+        for _ in range(5):
+            result = monitor.execute_with_monitoring("TransientService")
+            if result:
+                print(f"  ✓  {result}")
+            time.sleep(0.3 * DEMO_SLEEP)
 
-    report = reporter.generate_report(monitor.get_all_service_status())
-    print("\n" + reporter.format_report_text(report))
-    monitor.stop_service("TransientService")
+        report = reporter.generate_report(monitor.get_all_service_status())
+        print("\n" + reporter.format_report_text(report))
 
 
 def demo_recoverable_failures() -> None:
@@ -84,24 +100,18 @@ def demo_recoverable_failures() -> None:
     print("DEMO 3: Recoverable Failure Recovery  (Restart Strategy)")
     print(f"{DIVIDER}\n")
 
-    monitor = ServiceMonitor()
-    reporter = HealthReporter()
-
     svc = RecoverableFailureService("RecoverableService", corruption_threshold=3)
-    monitor.register_service(svc)
-    monitor.start_service("RecoverableService")
+    with make_env([svc]) as (monitor, reporter):
+        print("  State corrupts after every 3 operations — watch auto-restart...\n")
 
-    print("  State corrupts after every 3 operations — watch auto-restart...\n")
-
-    for _ in range(8):
-        result = monitor.execute_with_monitoring("RecoverableService")
-        if result:
-            print(f"  ✓  {result}")
-        time.sleep(0.3)
+        for _ in range(8):
+            result = monitor.execute_with_monitoring("RecoverableService")
+            if result:
+                print(f"  ✓  {result}")
+            time.sleep(0.3 * DEMO_SLEEP)
 
-    report = reporter.generate_report(monitor.get_all_service_status())
-    print("\n" + reporter.format_report_text(report))
-    monitor.stop_service("RecoverableService")
+        report = reporter.generate_report(monitor.get_all_service_status())
+        print("\n" + reporter.format_report_text(report))
 
 
 def demo_critical_failures() -> None:
@@ -110,24 +120,18 @@ def demo_critical_failures() -> None:
     print("DEMO 4: Critical Failure Handling  (Fallback → Degraded Mode)")
     print(f"{DIVIDER}\n")
 
-    monitor = ServiceMonitor()
-    reporter = HealthReporter()
-
     svc = CriticalFailureService("CriticalService", failure_at=5)
-    monitor.register_service(svc)
-    monitor.start_service("CriticalService")
-
-    print("  Service will hit a critical failure at execution #5...\n")
+    with make_env([svc]) as (monitor, reporter):
+        print("  Service will hit a critical failure at execution #5...\n")
 
-    for _ in range(8):
-        result = monitor.execute_with_monitoring("CriticalService")
-        if result:
-            print(f"  ✓  {result}")
-        time.sleep(0.3)
+        for _ in range(8):
+            result = monitor.execute_with_monitoring("CriticalService")
+            if result:
+                print(f"  ✓  {result}")
+            time.sleep(0.3 * DEMO_SLEEP)
 
-    report = reporter.generate_report(monitor.get_all_service_status())
-    print("\n" + reporter.format_report_text(report))
-    monitor.stop_service("CriticalService")
+        report = reporter.generate_report(monitor.get_all_service_status())
+        print("\n" + reporter.format_report_text(report))
 
 
 def demo_multi_service() -> None:
@@ -136,9 +140,6 @@ def demo_multi_service() -> None:
     print("DEMO 5: Multi-Service Monitoring  (Mixed Failure Patterns)")
     print(f"{DIVIDER}\n")
 
-    monitor = ServiceMonitor()
-    reporter = HealthReporter()
-
     services = [
         StableService("Stable-1"),
         TransientFailureService("Transient-1", failure_rate=0.2),
@@ -146,25 +147,19 @@ def demo_multi_service() -> None:
         IntermittentService("Intermittent-1"),
     ]
 
-    for svc in services:
-        monitor.register_service(svc)
-        monitor.start_service(svc.name)
-
-    print("  Running 4 services for 10 iterations...\n")
-
-    for iteration in range(1, 11):
-        print(f"  --- Iteration {iteration} ---")
-        for svc in services:
-            result = monitor.execute_with_monitoring(svc.name)
-            if result:
-                print(f"    {svc.name}: {str(result)[:60]}")
-        time.sleep(0.2)
+    with make_env(services) as (monitor, reporter):
+        print("  Running 4 services for 10 iterations...\n")
 
-    report = reporter.generate_report(monitor.get_all_service_status())
-    print("\n" + reporter.format_report_text(report))
+        for iteration in range(1, 11):
+            print(f"  --- Iteration {iteration} ---")
+            for svc in services:
+                result = monitor.execute_with_monitoring(svc.name)
+                if result:
+                    print(f"    {svc.name}: {str(result)[:60]}")
+            time.sleep(0.2 * DEMO_SLEEP)
 
-    for svc in services:
-        monitor.stop_service(svc.name)
+        report = reporter.generate_report(monitor.get_all_service_status())
+        print("\n" + reporter.format_report_text(report))
 
 
 # ======================================================================
@@ -192,7 +187,7 @@ def main() -> None:
     for demo in demos:
         try:
             demo()
-            time.sleep(1)
+            time.sleep(DEMO_SLEEP)
         except KeyboardInterrupt:
             print("\n\nDemonstration interrupted.")
             sys.exit(0)
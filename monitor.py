@@ -5,9 +5,13 @@ Continuously monitors managed services, detects failures,
 and triggers recovery procedures.
 """
 
+import asyncio
+import logging
+import sys
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Set
 
+from core.errors import ErrorSeverity
 from core.service import ManagedService, ServiceState
 from core.detector import FaultDetector
 from core.recovery import RecoveryOrchestrator
@@ -16,6 +20,11 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Pause between re-executions after a failure in the async monitored path:
+# base × 2^consecutive_failures seconds, capped at the maximum.
+_RETRY_BACKOFF_BASE = 0.05
+_RETRY_BACKOFF_MAX = 1.0
+
 
 class ServiceMonitor:
     """
@@ -29,7 +38,15 @@ class ServiceMonitor:
         self.services: Dict[str, ManagedService] = {}
         self.detector = FaultDetector()
         self.recovery = RecoveryOrchestrator()
-        self.monitoring: bool = False
+        # Set by stop_monitoring(); shared by all running monitor loops.
+        # Created by the first loop so it binds to the running event loop
+        # (on Python < 3.10 an Event binds to the loop current at creation).
+        self._stop_event: Optional[asyncio.Event] = None
+        self._active_loops: int = 0
+        # Per-service status dicts, rebuilt only for names marked dirty by a
+        # state change, a (un)registration, or a recorded failure.
+        self._status_cache: Dict[str, Dict[str, Any]] = {}
+        self._status_dirty: Set[str] = set()
 
     # ------------------------------------------------------------------
     # Service lifecycle management
@@ -37,39 +54,75 @@ class ServiceMonitor:
 
     def register_service(self, service: ManagedService) -> None:
         """Register a service for monitoring."""
+        # Names handed back by the monitor (monitor_all, status keys) are then
+        # the dict's own keys, so later lookups match on identity.
+        service.name = sys.intern(service.name)
         self.services[service.name] = service
+        service.add_state_listener(self._on_state_change)
+        self._status_dirty.add(service.name)
         logger.info(
             f"Registered service: '{service.name}'",
-            metadata={"state": service.get_state().value},
+            metadata={"state": service.get_state()},
         )
 
+    def register_services(
+        self, services: Iterable[ManagedService], start: bool = True
+    ) -> None:
+        """
+        Register several services, then optionally start them all.
+
+        Every service is registered before any is started.  Start failures
+        are logged by start_service() and do not stop the remaining starts.
+        """
+        names = []
+        for service in services:
+            self.register_service(service)
+            names.append(service.name)
+
+        if start:
+            for name in names:
+                self.start_service(name)
+
     def unregister_service(self, service_name: str) -> None:
         """Unregister a service (stops it first)."""
-        if service_name in self.services:
-            self.services[service_name].stop()
+        service = self.services.get(service_name)
+        if service is not None:
+            # Stop first: if stop() raises, the service stays registered.
+            service.stop()
             del self.services[service_name]
+            service.remove_state_listener(self._on_state_change)
+            # Clearing history reshapes the shared failure window, changing
+            # the counts of services leaving or entering it.
+            window = set(self.detector.recent_window())
             self.detector.clear_history(service_name)
+            window.update(self.detector.recent_window())
+            self._mark_dirty(window)
+            self._status_cache.pop(service_name, None)
+            self._status_dirty.discard(service_name)
             logger.info(f"Unregistered service: '{service_name}'")
 
     def start_service(self, service_name: str) -> bool:
         """Start a registered service. Returns True on success."""
-        if service_name not in self.services:
+        service = self.services.get(service_name)
+        if service is None:
             logger.error(f"start_service: '{service_name}' not found")
             return False
         try:
-            self.services[service_name].start()
+            service.start()
             logger.info(f"Started service: '{service_name}'")
             return True
         except Exception as exc:
-            logger.error(
-                f"Failed to start '{service_name}'", metadata={"error": str(exc)}
-            )
+            if logger.is_enabled(logging.ERROR):
+                logger.error(
+                    f"Failed to start '{service_name}'", metadata={"error": str(exc)}
+                )
             return False
 
     def stop_service(self, service_name: str) -> None:
         """Stop a registered service."""
-        if service_name in self.services:
-            self.services[service_name].stop()
+        service = self.services.get(service_name)
+        if service is not None:
+            service.stop()
             logger.info(f"Stopped service: '{service_name}'")
 
     # ------------------------------------------------------------------
@@ -91,18 +144,18 @@ class ServiceMonitor:
         Returns:
             Operation result, or None if all recovery attempts failed.
         """
-        if service_name not in self.services:
+        service = self.services.get(service_name)
+        if service is None:
             logger.error(f"execute_with_monitoring: '{service_name}' not found")
             return None
 
-        service = self.services[service_name]
         consecutive_failures = 0
 
         while consecutive_failures < max_failures:
             try:
                 result = service.execute()
 
-                if consecutive_failures > 0:
+                if consecutive_failures > 0 and logger.is_enabled(logging.INFO):
                     logger.info(
                         f"'{service_name}' recovered after {consecutive_failures} failure(s)"
                     )
@@ -111,15 +164,7 @@ class ServiceMonitor:
 
             except Exception as exc:
                 consecutive_failures += 1
-                logger.error(
-                    f"'{service_name}' execution failed",
-                    metadata={
-                        "error": str(exc),
-                        "consecutive_failures": consecutive_failures,
-                    },
-                )
-
-                severity = self.detector.classify_error(exc, service_name)
+                severity = self._record_failure(service_name, exc, consecutive_failures)
 
                 recovered = self.recovery.recover(
                     service=service,
@@ -128,24 +173,129 @@ class ServiceMonitor:
                     operation=service.execute,
                 )
 
+                if self._settle_recovery(
+                    service, severity, recovered, consecutive_failures, max_failures
+                ):
+                    return None
                 if recovered:
-                    logger.info(f"Recovery succeeded for '{service_name}'")
                     consecutive_failures = 0
-                else:
-                    logger.error(
-                        f"Recovery failed for '{service_name}' "
-                        f"(consecutive_failures={consecutive_failures})"
+
+        return None
+
+    async def execute_with_monitoring_async(
+        self,
+        service_name: str,
+        max_failures: int = 5,
+    ) -> Optional[Any]:
+        """
+        Awaitable counterpart of execute_with_monitoring().
+
+        The service runs through ManagedService.aexecute() and recovery
+        through RecoveryOrchestrator.arecover(), so executions and backoff
+        delays of different services can interleave on one event loop.
+        """
+        service = self.services.get(service_name)
+        if service is None:
+            logger.error(f"execute_with_monitoring_async: '{service_name}' not found")
+            return None
+
+        consecutive_failures = 0
+
+        while consecutive_failures < max_failures:
+            try:
+                result = await service.aexecute()
+
+                if consecutive_failures > 0 and logger.is_enabled(logging.INFO):
+                    logger.info(
+                        f"'{service_name}' recovered after {consecutive_failures} failure(s)"
                     )
-                    if consecutive_failures >= max_failures:
-                        logger.critical(
-                            f"Max failures ({max_failures}) reached for '{service_name}' — giving up"
-                        )
-                        service.set_state(ServiceState.STOPPED_WITH_ERROR)
-                        return None
+                consecutive_failures = 0
+                return result
+
+            except Exception as exc:
+                consecutive_failures += 1
+                severity = self._record_failure(service_name, exc, consecutive_failures)
+
+                recovered = await self.recovery.arecover(
+                    service=service,
+                    error=exc,
+                    severity=severity,
+                    operation=service.aexecute,
+                )
+
+                if self._settle_recovery(
+                    service, severity, recovered, consecutive_failures, max_failures
+                ):
+                    return None
+                if recovered:
+                    consecutive_failures = 0
+
+                # Yield to the loop and back off before re-executing, so a
+                # service failing in a tight loop does not spin the CPU.
+                await asyncio.sleep(
+                    min(_RETRY_BACKOFF_BASE * 2 ** consecutive_failures, _RETRY_BACKOFF_MAX)
+                )
 
         return None
 
-    def monitor_loop(
+    def _record_failure(
+        self, service_name: str, exc: Exception, consecutive_failures: int
+    ) -> ErrorSeverity:
+        """Log a failed execution and classify it."""
+        if logger.is_enabled(logging.ERROR):
+            logger.error(
+                f"'{service_name}' execution failed",
+                metadata={
+                    "error": str(exc),
+                    "consecutive_failures": consecutive_failures,
+                },
+            )
+        # The recent-failure window is shared: a new entry also lowers the
+        # count of the service whose failure it pushes out.
+        window = self.detector.recent_window()
+        severity = self.detector.classify_error(exc, service_name)
+        if len(window) == self.detector.pattern_window:
+            self._mark_dirty((service_name, window[0]))
+        else:
+            self._mark_dirty((service_name,))
+        return severity
+
+    def _settle_recovery(
+        self,
+        service: ManagedService,
+        severity: ErrorSeverity,
+        recovered: bool,
+        consecutive_failures: int,
+        max_failures: int,
+    ) -> bool:
+        """Log the recovery outcome; return True if monitoring should give up."""
+        if recovered:
+            if logger.is_enabled(logging.INFO):
+                logger.info(f"Recovery succeeded for '{service.name}'")
+            return False
+
+        if logger.is_enabled(logging.ERROR):
+            logger.error(
+                f"Recovery failed for '{service.name}' "
+                f"(consecutive_failures={consecutive_failures})"
+            )
+        if severity is ErrorSeverity.CRITICAL:
+            # Fallback is the only remedy for critical errors; re-executing
+            # would just spend the remaining failure budget.
+            logger.critical(
+                f"Unrecovered CRITICAL failure in '{service.name}' — giving up"
+            )
+            service.set_state(ServiceState.STOPPED_WITH_ERROR)
+            return True
+        if consecutive_failures >= max_failures:
+            logger.critical(
+                f"Max failures ({max_failures}) reached for '{service.name}' — giving up"
+            )
+            service.set_state(ServiceState.STOPPED_WITH_ERROR)
+            return True
+        return False
+
+    async def monitor_loop(
         self,
         service_name: str,
         interval: float = 5.0,
@@ -154,6 +304,10 @@ class ServiceMonitor:
         """
         Continuously monitor a service in a loop.
 
+        Runs as a coroutine on top of execute_with_monitoring_async(), so
+        loops for many services can share one event loop.  The wait between
+        executions ends early when stop_monitoring() is called.
+
         Args:
             service_name: Service to monitor.
             interval:     Seconds between executions.
@@ -164,21 +318,148 @@ class ServiceMonitor:
             metadata={"interval": interval, "duration": duration},
         )
 
-        start_time = time.time()
-        self.monitoring = True
+        # The first loop of a monitoring session starts from a fresh event,
+        # which also binds it to the currently running event loop.
+        if not self._active_loops:
+            self._stop_event = asyncio.Event()
+        self._active_loops += 1
 
-        while self.monitoring:
-            if duration and (time.time() - start_time) >= duration:
-                logger.info(f"Monitoring duration reached for '{service_name}'")
-                break
-            self.execute_with_monitoring(service_name)
-            time.sleep(interval)
+        start_time = time.monotonic()
+        try:
+            while not self._stop_event.is_set():
+                if duration and (time.monotonic() - start_time) >= duration:
+                    logger.info(f"Monitoring duration reached for '{service_name}'")
+                    break
+                await self.execute_with_monitoring_async(service_name)
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._active_loops -= 1
 
         logger.info(f"Monitor loop ended for '{service_name}'")
 
+    async def monitor_all(
+        self,
+        interval: float = 5.0,
+        duration: Optional[float] = None,
+        workers: Optional[int] = None,
+    ) -> None:
+        """
+        Monitor every registered service concurrently.
+
+        By default runs one monitor_loop() per service.  With *workers*, a
+        pool of that many coroutines instead drains a queue of services
+        ordered by when each is next due, which bounds how many executions
+        run at once.  Either way all monitoring shares the current event
+        loop and stops on stop_monitoring().
+
+        Args:
+            interval: Seconds between executions of each service.
+            duration: Total run time in seconds (None = run forever).
+            workers:  Size of the worker pool (None = one loop per service).
+
+        Raises:
+            ValueError: If *workers* is less than 1.
+        """
+        if workers is not None:
+            if workers < 1:
+                raise ValueError(f"workers must be at least 1, got {workers}")
+            await self._monitor_pool(interval, duration, workers)
+            return
+
+        names = list(self.services)
+        results = await asyncio.gather(
+            *(self.monitor_loop(name, interval, duration) for name in names),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Monitor loop for '{name}' failed",
+                    metadata={"error": str(result)},
+                )
+
+    async def _monitor_pool(
+        self, interval: float, duration: Optional[float], workers: int
+    ) -> None:
+        """Run monitor_all() with a bounded pool of worker coroutines."""
+        now = time.monotonic()
+        end_time = now + duration if duration else None
+
+        # (due time, service name); services registered later are not picked up.
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        for name in self.services:
+            queue.put_nowait((now, name))
+
+        logger.info(
+            "Starting monitor pool",
+            metadata={"services": queue.qsize(), "workers": workers, "interval": interval},
+        )
+
+        if not self._active_loops:
+            self._stop_event = asyncio.Event()
+        self._active_loops += 1
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._monitor_worker(queue, interval, end_time)
+                    for _ in range(min(workers, queue.qsize()))
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            self._active_loops -= 1
+
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(
+                    "Monitor pool worker failed", metadata={"error": str(result)}
+                )
+        logger.info("Monitor pool ended")
+
+    async def _monitor_worker(
+        self,
+        queue: asyncio.PriorityQueue,
+        interval: float,
+        end_time: Optional[float],
+    ) -> None:
+        """
+        Execute services from *queue* as they fall due, requeueing each.
+
+        A worker that finds the queue empty exits: every other item is held
+        by a worker that requeues it itself, so nothing is left unserved.
+        """
+        while not self._stop_event.is_set():
+            try:
+                due, name = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            if end_time is not None and due >= end_time:
+                return
+
+            delay = due - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+                    return
+                except asyncio.TimeoutError:
+                    pass
+
+            if name in self.services:
+                await self.execute_with_monitoring_async(name)
+                queue.put_nowait((time.monotonic() + interval, name))
+
     def stop_monitoring(self) -> None:
-        """Signal all monitor loops to stop."""
-        self.monitoring = False
+        """
+        Signal all monitor loops to stop.
+
+        Must be called from the thread running the event loop; from other
+        threads use ``loop.call_soon_threadsafe(monitor.stop_monitoring)``.
+        """
+        if self._stop_event is not None:
+            self._stop_event.set()
         logger.info("Monitoring stopped")
 
     # ------------------------------------------------------------------
@@ -186,19 +467,58 @@ class ServiceMonitor:
     # ------------------------------------------------------------------
 
     def get_service_status(self, service_name: str) -> Dict[str, Any]:
-        """Return a status dict for one service."""
-        if service_name not in self.services:
+        """
+        Return a status dict for one service.
+
+        Everything except metadata is cached until the service changes
+        state or a failure is recorded.  Each call returns a new dict with
+        a plain-dict snapshot of the current metadata, so it is safe to
+        modify and to serialize.
+        """
+        service = self.services.get(service_name)
+        if service is None:
             return {"error": "Service not found"}
 
-        service = self.services[service_name]
-        return {
-            "name": service_name,
-            "state": service.get_state().value,
-            "healthy": service.health_check(),
-            "recent_failures": self.detector.get_failure_count(service_name),
-            "metadata": service.get_metadata(),
-        }
+        status = self._status_cache.get(service_name)
+        if status is None:
+            # Services added to self.services directly bypassed
+            # register_service(); listen to them from now on.
+            service.add_state_listener(self._on_state_change)
+        if status is None or service_name in self._status_dirty:
+            status = {
+                "name": service_name,
+                "state": service.get_state(),
+                "healthy": service.health_check(),
+                "recent_failures": self.detector.get_failure_count(service_name),
+            }
+            self._status_cache[service_name] = status
+            self._status_dirty.discard(service_name)
+
+        return {**status, "metadata": dict(service.get_metadata())}
 
     def get_all_service_status(self) -> Dict[str, Dict]:
         """Return status dicts for all registered services."""
         return {name: self.get_service_status(name) for name in self.services}
+
+    def invalidate_status(self, service_name: Optional[str] = None) -> None:
+        """
+        Force the next status query to rebuild *service_name*'s status.
+
+        With no name, every service is invalidated.  Needed only when a
+        service's health_check() result changes without a state change.
+        """
+        if service_name is None:
+            self._status_dirty.update(self.services)
+        elif service_name in self.services:
+            self._status_dirty.add(service_name)
+
+    def _mark_dirty(self, service_names: Iterable[str]) -> None:
+        """Invalidate the cached status of each registered name given."""
+        services = self.services
+        self._status_dirty.update(
+            name for name in service_names if name in services
+        )
+
+    def _on_state_change(self, service: ManagedService) -> None:
+        """State listener registered on every monitored service."""
+        self._status_dirty.add(service.name)
@@ -5,9 +5,12 @@ Defines different recovery strategies (retry, restart, fallback)
 and orchestrates their application based on error severity.
 """
 
+import asyncio
+import inspect
+import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Generator, Optional, Tuple
 
 from core.errors import ErrorSeverity
 from core.service import ManagedService, ServiceState
@@ -44,6 +47,70 @@ class RecoveryStrategy(ABC):
         """
         pass
 
+    async def arecover(
+        self,
+        service: ManagedService,
+        error: Exception,
+        operation: Optional[Callable] = None,
+    ) -> bool:
+        """
+        Awaitable variant of recover().
+
+        The default simply delegates to recover(), which is right for
+        strategies that never wait.  Strategies that back off override it
+        to sleep with asyncio instead of blocking the event loop.
+        *operation* may return an awaitable, which is awaited.
+        """
+        return self.recover(service, error, operation)
+
+
+# ======================================================================
+# Step drivers
+# ======================================================================
+
+# A strategy's recovery steps, shared by recover() and arecover(): the
+# generator yields each delay to wait, is sent the exception raised by the
+# operation run after that delay (None on success), and returns the result.
+_Steps = Generator[float, Optional[Exception], bool]
+
+
+def _run(steps: _Steps, operation: Optional[Callable] = None) -> bool:
+    """Drive *steps* synchronously, blocking for each delay."""
+    try:
+        delay = next(steps)
+        while True:
+            if delay:
+                time.sleep(delay)
+            try:
+                if operation is not None:
+                    operation()
+                outcome = None
+            except Exception as exc:
+                outcome = exc
+            delay = steps.send(outcome)
+    except StopIteration as done:
+        return done.value
+
+
+async def _arun(steps: _Steps, operation: Optional[Callable] = None) -> bool:
+    """Drive *steps* on the event loop; *operation* may return an awaitable."""
+    try:
+        delay = next(steps)
+        while True:
+            if delay:
+                await asyncio.sleep(delay)
+            try:
+                if operation is not None:
+                    result = operation()
+                    if inspect.isawaitable(result):
+                        await result
+                outcome = None
+            except Exception as exc:
+                outcome = exc
+            delay = steps.send(outcome)
+    except StopIteration as done:
+        return done.value
+
 
 # ======================================================================
 # Concrete strategies
@@ -67,32 +134,38 @@ class RetryStrategy(RecoveryStrategy):
         error: Exception,
         operation: Optional[Callable] = None,
     ) -> bool:
+        return _run(self._attempts(service, operation), operation)
+
+    async def arecover(
+        self,
+        service: ManagedService,
+        error: Exception,
+        operation: Optional[Callable] = None,
+    ) -> bool:
+        return await _arun(self._attempts(service, operation), operation)
+
+    def _attempts(self, service: ManagedService, operation: Optional[Callable]) -> _Steps:
+        """Retry loop: yield the delay before each attempt, receive its outcome."""
         if operation is None:
             logger.error("RetryStrategy requires an operation callable.")
             return False
 
-        logger.info(
-            f"RetryStrategy: starting for '{service.name}'",
-            metadata={"max_attempts": self.max_attempts},
-        )
+        if logger.is_enabled(logging.INFO):
+            logger.info(
+                f"RetryStrategy: starting for '{service.name}'",
+                metadata={"max_attempts": self.max_attempts},
+            )
 
         for attempt in range(1, self.max_attempts + 1):
-            if attempt > 1:
-                delay = self.base_delay * (2 ** (attempt - 2))
-                logger.debug(
-                    f"  Retry {attempt}/{self.max_attempts} — waiting {delay:.1f}s",
-                    metadata={"service": service.name},
-                )
-                time.sleep(delay)
-
-            try:
-                operation()
-                logger.info(
-                    f"RetryStrategy: succeeded for '{service.name}'",
-                    metadata={"attempt": attempt},
-                )
+            exc = yield self._backoff(service, attempt) if attempt > 1 else 0.0
+            if exc is None:
+                if logger.is_enabled(logging.INFO):
+                    logger.info(
+                        f"RetryStrategy: succeeded for '{service.name}'",
+                        metadata={"attempt": attempt},
+                    )
                 return True
-            except Exception as exc:
+            if logger.is_enabled(logging.WARNING):
                 logger.warning(
                     f"  Attempt {attempt} failed for '{service.name}'",
                     metadata={"error": str(exc)},
@@ -101,6 +174,16 @@ class RetryStrategy(RecoveryStrategy):
         logger.error(f"RetryStrategy: all attempts exhausted for '{service.name}'")
         return False
 
+    def _backoff(self, service: ManagedService, attempt: int) -> float:
+        """Return the delay before *attempt* (2 or later)."""
+        delay = self.base_delay * (2 ** (attempt - 2))
+        if logger.is_enabled(logging.DEBUG):
+            logger.debug(
+                f"  Retry {attempt}/{self.max_attempts} — waiting {delay:.1f}s",
+                metadata={"service": service.name},
+            )
+        return delay
+
 
 class RestartStrategy(RecoveryStrategy):
     """
@@ -119,37 +202,59 @@ class RestartStrategy(RecoveryStrategy):
         error: Exception,
         operation: Optional[Callable] = None,
     ) -> bool:
-        logger.info(
-            f"RestartStrategy: starting for '{service.name}'",
-            metadata={"cleanup_state": self.cleanup_state},
-        )
+        return _run(self._restart(service))
+
+    async def arecover(
+        self,
+        service: ManagedService,
+        error: Exception,
+        operation: Optional[Callable] = None,
+    ) -> bool:
+        return await _arun(self._restart(service))
+
+    def _restart(self, service: ManagedService) -> _Steps:
+        """Stop, yield the restart delay, then start *service* again."""
+        if logger.is_enabled(logging.INFO):
+            logger.info(
+                f"RestartStrategy: starting for '{service.name}'",
+                metadata={"cleanup_state": self.cleanup_state},
+            )
 
         try:
-            service.stop()
+            self._shut_down(service)
+            yield self.restart_delay
+            return self._bring_up(service)
 
-            if self.cleanup_state:
-                service.metadata.clear()
-                logger.debug(f"  State cleared for '{service.name}'")
+        except Exception as exc:
+            if logger.is_enabled(logging.ERROR):
+                logger.error(
+                    f"RestartStrategy: restart failed for '{service.name}'",
+                    metadata={"error": str(exc)},
+                )
+            return False
 
-            time.sleep(self.restart_delay)
-            service.start()
+    def _shut_down(self, service: ManagedService) -> None:
+        """Stop the service and, if configured, clear its state."""
+        service.stop()
 
-            if service.get_state() == ServiceState.RUNNING:
-                logger.info(f"RestartStrategy: '{service.name}' is RUNNING again")
-                return True
+        if self.cleanup_state:
+            service.metadata.clear()
+            if logger.is_enabled(logging.DEBUG):
+                logger.debug(f"  State cleared for '{service.name}'")
 
-            logger.error(
-                f"RestartStrategy: '{service.name}' not RUNNING after restart "
-                f"(state={service.get_state().value})"
-            )
-            return False
+    def _bring_up(self, service: ManagedService) -> bool:
+        """Start the service again; return True if it is RUNNING."""
+        service.start()
 
-        except Exception as exc:
-            logger.error(
-                f"RestartStrategy: restart failed for '{service.name}'",
-                metadata={"error": str(exc)},
-            )
-            return False
+        if service.get_state() == ServiceState.RUNNING:
+            logger.info(f"RestartStrategy: '{service.name}' is RUNNING again")
+            return True
+
+        logger.error(
+            f"RestartStrategy: '{service.name}' not RUNNING after restart "
+            f"(state={service.get_state()})"
+        )
+        return False
 
 
 class FallbackStrategy(RecoveryStrategy):
@@ -183,10 +288,11 @@ class FallbackStrategy(RecoveryStrategy):
             return True
 
         except Exception as exc:
-            logger.error(
-                f"FallbackStrategy: failed for '{service.name}'",
-                metadata={"error": str(exc)},
-            )
+            if logger.is_enabled(logging.ERROR):
+                logger.error(
+                    f"FallbackStrategy: failed for '{service.name}'",
+                    metadata={"error": str(exc)},
+                )
             return False
 
 
@@ -202,12 +308,55 @@ class RecoveryOrchestrator:
       TRANSIENT   → Retry  → (if fails) Restart
       RECOVERABLE → Restart → (if fails) Fallback
       CRITICAL    → Fallback only (log critical alert)
+
+    Each severity maps to the tuple of strategies tried in order.  The
+    tuples are built in __init__ and rebuilt whenever a strategy attribute
+    is reassigned, so a recovery costs one dict lookup.
     """
 
     def __init__(self):
-        self.retry_strategy = RetryStrategy(max_attempts=3, base_delay=1.0)
-        self.restart_strategy = RestartStrategy(cleanup_state=True)
-        self.fallback_strategy = FallbackStrategy()
+        self._retry_strategy = RetryStrategy(max_attempts=3, base_delay=1.0)
+        self._restart_strategy = RestartStrategy(cleanup_state=True)
+        self._fallback_strategy = FallbackStrategy()
+        self._build_chains()
+
+    @property
+    def retry_strategy(self) -> RecoveryStrategy:
+        """First step for TRANSIENT errors."""
+        return self._retry_strategy
+
+    @retry_strategy.setter
+    def retry_strategy(self, strategy: RecoveryStrategy) -> None:
+        self._retry_strategy = strategy
+        self._build_chains()
+
+    @property
+    def restart_strategy(self) -> RecoveryStrategy:
+        """Escalation for TRANSIENT, first step for RECOVERABLE errors."""
+        return self._restart_strategy
+
+    @restart_strategy.setter
+    def restart_strategy(self, strategy: RecoveryStrategy) -> None:
+        self._restart_strategy = strategy
+        self._build_chains()
+
+    @property
+    def fallback_strategy(self) -> RecoveryStrategy:
+        """Last resort for RECOVERABLE, only step for CRITICAL errors."""
+        return self._fallback_strategy
+
+    @fallback_strategy.setter
+    def fallback_strategy(self, strategy: RecoveryStrategy) -> None:
+        self._fallback_strategy = strategy
+        self._build_chains()
+
+    def _build_chains(self) -> None:
+        """Map each severity to the strategies tried for it, in order."""
+        self._chains: Dict[ErrorSeverity, Tuple[RecoveryStrategy, ...]] = {
+            ErrorSeverity.TRANSIENT: (self._retry_strategy, self._restart_strategy),
+            ErrorSeverity.RECOVERABLE: (self._restart_strategy, self._fallback_strategy),
+            ErrorSeverity.CRITICAL: (self._fallback_strategy,),
+        }
 
     def recover(
         self,
@@ -221,28 +370,70 @@ class RecoveryOrchestrator:
 
         Returns True if any recovery strategy succeeds.
         """
-        logger.info(
-            f"RecoveryOrchestrator: recovering '{service.name}'",
-            metadata={"severity": severity.value, "error_type": type(error).__name__},
-        )
+        chain = self._start(service, error, severity)
 
-        if severity == ErrorSeverity.TRANSIENT:
-            if self.retry_strategy.recover(service, error, operation):
+        for index, strategy in enumerate(chain):
+            if index:
+                self._log_escalation(service, chain[index - 1], strategy)
+            if strategy.recover(service, error, operation):
                 return True
-            logger.info(f"  Retry failed — escalating to Restart for '{service.name}'")
-            return self.restart_strategy.recover(service, error)
 
-        if severity == ErrorSeverity.RECOVERABLE:
-            if self.restart_strategy.recover(service, error):
+        return False
+
+    async def arecover(
+        self,
+        service: ManagedService,
+        error: Exception,
+        severity: ErrorSeverity,
+        operation: Optional[Callable] = None,
+    ) -> bool:
+        """
+        Awaitable counterpart of recover().
+
+        Uses each strategy's arecover(), so backoff and restart delays
+        yield to the event loop instead of blocking it.
+        """
+        chain = self._start(service, error, severity)
+
+        for index, strategy in enumerate(chain):
+            if index:
+                self._log_escalation(service, chain[index - 1], strategy)
+            if await strategy.arecover(service, error, operation):
                 return True
-            logger.info(f"  Restart failed — escalating to Fallback for '{service.name}'")
-            return self.fallback_strategy.recover(service, error)
 
-        if severity == ErrorSeverity.CRITICAL:
+        return False
+
+    def _start(
+        self, service: ManagedService, error: Exception, severity: ErrorSeverity
+    ) -> Tuple[RecoveryStrategy, ...]:
+        """Log the recovery request and return the chain for *severity*."""
+        if logger.is_enabled(logging.INFO):
+            logger.info(
+                f"RecoveryOrchestrator: recovering '{service.name}'",
+                metadata={"severity": severity, "error_type": type(error).__name__},
+            )
+
+        if severity is ErrorSeverity.CRITICAL and logger.is_enabled(logging.CRITICAL):
             logger.critical(
                 f"CRITICAL failure in '{service.name}' — applying Fallback only",
                 metadata={"error": str(error)},
             )
-            return self.fallback_strategy.recover(service, error)
 
-        return False
+        return self._chains.get(severity, ())
+
+    @staticmethod
+    def _log_escalation(
+        service: ManagedService, failed: RecoveryStrategy, next_: RecoveryStrategy
+    ) -> None:
+        """Log that *failed* did not recover *service* and *next_* is up."""
+        if logger.is_enabled(logging.INFO):
+            logger.info(
+                f"  {_label(failed)} failed — escalating to {_label(next_)} "
+                f"for '{service.name}'"
+            )
+
+
+def _label(strategy: RecoveryStrategy) -> str:
+    """Short display name of *strategy*, e.g. ``Retry`` for RetryStrategy."""
+    name = type(strategy).__name__
+    return name[: -len("Strategy")] if name.endswith("Strategy") else name
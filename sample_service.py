@@ -7,7 +7,9 @@ failure pattern to exercise different recovery strategies in the framework.
 
 import random
 import time
-from typing import Any
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Optional
 
 from core.service import ManagedService, ServiceState
 from core.errors import (
@@ -16,6 +18,11 @@ from core.errors import (
     CriticalError,
 )
 
+# Compared at the top of every execute(); ManagedService always stores
+# ServiceState members, so identity checks are exact.
+_RUNNING = ServiceState.RUNNING
+_DEGRADED = ServiceState.DEGRADED
+
 
 # ======================================================================
 # 1. Stable service — never fails
@@ -24,6 +31,8 @@ from core.errors import (
 class StableService(ManagedService):
     """A service that runs reliably without failures."""
 
+    __slots__ = ("execution_count",)
+
     def __init__(self, name: str = "StableService"):
         super().__init__(name)
         self.execution_count: int = 0
@@ -38,7 +47,7 @@ class StableService(ManagedService):
         self.metadata["stopped_at"] = time.time()
 
     def execute(self) -> Any:
-        if self.state != ServiceState.RUNNING:
+        if self._state is not _RUNNING:
             raise RuntimeError("Service is not running")
         self.execution_count += 1
         self.metadata["last_execution"] = time.time()
@@ -55,11 +64,23 @@ class TransientFailureService(ManagedService):
 
     Args:
         failure_rate: Probability [0, 1] of failure on each execute() call.
+        seed:         Seed for the service's own random generator (None = unseeded).
     """
 
-    def __init__(self, name: str = "TransientFailureService", failure_rate: float = 0.3):
+    __slots__ = (
+        "failure_rate", "execution_count", "successful_count", "failed_count", "_random"
+    )
+
+    def __init__(
+        self,
+        name: str = "TransientFailureService",
+        failure_rate: float = 0.3,
+        seed: Optional[int] = None,
+    ):
         super().__init__(name)
         self.failure_rate = failure_rate
+        # Bound draw method of a private generator, resolved once.
+        self._random = random.Random(seed).random
         self.execution_count: int = 0
         self.successful_count: int = 0
         self.failed_count: int = 0
@@ -76,12 +97,12 @@ class TransientFailureService(ManagedService):
         self.metadata["stopped_at"] = time.time()
 
     def execute(self) -> Any:
-        if self.state != ServiceState.RUNNING:
+        if self._state is not _RUNNING:
             raise RuntimeError("Service is not running")
 
         self.execution_count += 1
 
-        if random.random() < self.failure_rate:
+        if self._random() < self.failure_rate:
             self.failed_count += 1
             self.metadata["last_failure"] = time.time()
             raise NetworkTimeoutError(
@@ -110,6 +131,8 @@ class RecoverableFailureService(ManagedService):
         corruption_threshold: Operations allowed before state corrupts.
     """
 
+    __slots__ = ("corruption_threshold", "execution_count", "ops_since_restart")
+
     def __init__(
         self, name: str = "RecoverableFailureService", corruption_threshold: int = 5
     ):
@@ -129,7 +152,7 @@ class RecoverableFailureService(ManagedService):
         self.metadata["stopped_at"] = time.time()
 
     def execute(self) -> Any:
-        if self.state != ServiceState.RUNNING:
+        if self._state is not _RUNNING:
             raise RuntimeError("Service is not running")
 
         self.execution_count += 1
@@ -162,6 +185,8 @@ class CriticalFailureService(ManagedService):
         failure_at: Execution number on which the critical failure fires.
     """
 
+    __slots__ = ("failure_at", "execution_count")
+
     def __init__(self, name: str = "CriticalFailureService", failure_at: int = 10):
         super().__init__(name)
         self.failure_at = failure_at
@@ -177,10 +202,10 @@ class CriticalFailureService(ManagedService):
         self.metadata["stopped_at"] = time.time()
 
     def execute(self) -> Any:
-        if self.state == ServiceState.DEGRADED:
+        if self._state is _DEGRADED:
             return "Running in DEGRADED mode — limited functionality available"
 
-        if self.state != ServiceState.RUNNING:
+        if self._state is not _RUNNING:
             raise RuntimeError("Service is not running")
 
         self.execution_count += 1
@@ -205,6 +230,12 @@ class IntermittentService(ManagedService):
     Randomly mixes success, transient errors, recoverable errors,
     and (rarely) critical errors.  Good for testing the full
     classification and recovery pipeline end-to-end.
+
+    The *_PROB class attributes are read when a service is created;
+    override them on a subclass (or the class) before instantiating.
+
+    Args:
+        seed: Seed for the service's own random generator (None = unseeded).
     """
 
     TRANSIENT_PROB = 0.15   # 15 %
@@ -212,9 +243,28 @@ class IntermittentService(ManagedService):
     CRITICAL_PROB = 0.02    # 2 %
     # Success: remaining ~73 %
 
-    def __init__(self, name: str = "IntermittentService"):
+    # The outcome selected by each band of the cumulative thresholds in
+    # _cdf; a draw at or above the last threshold is a success.
+    _OUTCOMES = (
+        (CriticalError, "Random critical failure"),
+        (StateCorruptionError, "Random state corruption"),
+        (NetworkTimeoutError, "Random network timeout"),
+        None,
+    )
+
+    __slots__ = ("execution_count", "_random", "_cdf")
+
+    def __init__(self, name: str = "IntermittentService", seed: Optional[int] = None):
         super().__init__(name)
         self.execution_count: int = 0
+        # Private generator: no shared module state between services.
+        self._random = random.Random(seed).random
+        # Thresholds come from the probabilities on type(self) at creation,
+        # so subclasses and class-level overrides take effect.
+        cls = type(self)
+        self._cdf = tuple(
+            accumulate((cls.CRITICAL_PROB, cls.RECOVERABLE_PROB, cls.TRANSIENT_PROB))
+        )
 
     def start(self) -> None:
         self.set_state(ServiceState.RUNNING)
@@ -226,20 +276,14 @@ class IntermittentService(ManagedService):
         self.metadata["stopped_at"] = time.time()
 
     def execute(self) -> Any:
-        if self.state != ServiceState.RUNNING:
+        if self._state is not _RUNNING:
             raise RuntimeError("Service is not running")
 
         self.execution_count += 1
-        rand = random.random()
-
-        if rand < self.CRITICAL_PROB:
-            raise CriticalError("Random critical failure")
-
-        if rand < self.CRITICAL_PROB + self.RECOVERABLE_PROB:
-            raise StateCorruptionError("Random state corruption")
-
-        if rand < self.CRITICAL_PROB + self.RECOVERABLE_PROB + self.TRANSIENT_PROB:
-            raise NetworkTimeoutError("Random network timeout")
+        outcome = self._OUTCOMES[bisect_right(self._cdf, self._random())]
+        if outcome is not None:
+            error_cls, message = outcome
+            raise error_cls(message)
 
         self.metadata["last_execution"] = time.time()
         return f"Execution #{self.execution_count} completed"
@@ -5,12 +5,14 @@ Defines the contract that all managed services must implement
 to be compatible with the self-healing framework.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping
 
 
-class ServiceState(Enum):
+class ServiceState(str, Enum):
     """Possible states for a managed service."""
     STOPPED = "stopped"
     STARTING = "starting"
@@ -19,6 +21,13 @@ class ServiceState(Enum):
     FAILING = "failing"
     STOPPED_WITH_ERROR = "stopped_with_error"
 
+    def __str__(self) -> str:
+        return self.value
+
+
+# States in which the default health_check() reports a service healthy.
+_HEALTHY_STATES = frozenset((ServiceState.RUNNING, ServiceState.DEGRADED))
+
 
 class ManagedService(ABC):
     """
@@ -26,12 +35,22 @@ class ManagedService(ABC):
 
     All services must implement start(), stop(), and execute() methods.
     The framework will monitor execution and apply recovery strategies on failure.
+
+    The state is only ever written through set_state() (assigning to
+    ``state`` routes there too), which stores a ServiceState member.  Readers
+    therefore always see a whole member and may compare it by identity.
+
+    Subclasses that declare their own ``__slots__`` keep instances free of a
+    per-instance ``__dict__``; those that do not simply get one back.
     """
 
+    __slots__ = ("name", "_state", "_metadata", "_metadata_view", "_state_listeners")
+
     def __init__(self, name: str):
         self.name = name
-        self.state = ServiceState.STOPPED
-        self.metadata: Dict[str, Any] = {}
+        self._state = ServiceState.STOPPED
+        self.metadata = {}
+        self._state_listeners: List[Callable[["ManagedService"], None]] = []
 
     @abstractmethod
     def start(self) -> None:
@@ -63,17 +82,66 @@ class ManagedService(ABC):
         """
         pass
 
+    async def aexecute(self) -> Any:
+        """
+        Awaitable variant of execute(), used by the asynchronous monitor.
+
+        The default runs execute() in a worker thread so that blocking
+        service code does not stall the event loop.  Services doing native
+        asyncio I/O should override it.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.execute)
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Mutable service metadata."""
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata: Dict[str, Any]) -> None:
+        self._metadata = metadata
+        # Built once per dict so get_metadata() allocates nothing.
+        self._metadata_view = MappingProxyType(metadata)
+
+    @property
+    def state(self) -> ServiceState:
+        """Current service state."""
+        return self._state
+
+    @state.setter
+    def state(self, state: ServiceState) -> None:
+        self.set_state(state)
+
     def get_state(self) -> ServiceState:
         """Get current service state."""
-        return self.state
+        return self._state
 
     def set_state(self, state: ServiceState) -> None:
-        """Set service state."""
-        self.state = state
+        """Set service state, notifying state listeners if it changed."""
+        state = ServiceState(state)
+        if state is self._state:
+            return
+        self._state = state
+        for listener in self._state_listeners:
+            listener(self)
+
+    def add_state_listener(self, listener: Callable[["ManagedService"], None]) -> None:
+        """Call *listener(service)* after every state change made via set_state()."""
+        if listener not in self._state_listeners:
+            self._state_listeners.append(listener)
+
+    def remove_state_listener(self, listener: Callable[["ManagedService"], None]) -> None:
+        """Stop notifying *listener*; unknown listeners are ignored."""
+        if listener in self._state_listeners:
+            self._state_listeners.remove(listener)
+
+    def get_metadata(self) -> Mapping[str, Any]:
+        """
+        Get a read-only, live view of the service metadata.
 
-    def get_metadata(self) -> Dict[str, Any]:
-        """Get service metadata."""
-        return self.metadata.copy()
+        Use ``dict(service.get_metadata())`` for a snapshot.
+        """
+        return self._metadata_view
 
     def health_check(self) -> bool:
         """
@@ -84,4 +152,4 @@ class ManagedService(ABC):
         Returns:
             True if service is healthy, False otherwise.
         """
-        return self.state in [ServiceState.RUNNING, ServiceState.DEGRADED]
+        return self._state in _HEALTHY_STATES
@@ -4,8 +4,18 @@ Unit tests for the self-healing framework.
 Run with:
     pytest tests/ -v
     pytest tests/ --cov=core --cov=services --cov-report=term-missing
+    pytest tests/ -n auto          # in parallel (pytest-xdist)
+    pytest tests/ -m "not slow"    # skip tests that wait on real time
 """
 
+import asyncio
+import copy
+import json
+import logging
+import time
+from contextlib import nullcontext
+from types import MappingProxyType
+
 import pytest
 
 from core.errors import (
@@ -16,7 +26,7 @@ from core.errors import (
     NetworkTimeoutError,
     StateCorruptionError,
 )
-from core.service import ServiceState
+from core.service import ManagedService, ServiceState
 from core.detector import FaultDetector
 from core.recovery import (
     RetryStrategy,
@@ -26,7 +36,93 @@ from core.recovery import (
 )
 from core.monitor import ServiceMonitor
 from core.health import HealthReporter, SystemHealth
-from services.sample_service import StableService, TransientFailureService
+from utils.logger import get_logger
+from services.sample_service import (
+    StableService,
+    TransientFailureService,
+    CriticalFailureService,
+    IntermittentService,
+)
+
+
+# Plain state / health strings, as a serialized status or report carries them.
+_RUNNING_STATE = ServiceState.RUNNING.value
+_DEGRADED_STATE = ServiceState.DEGRADED.value
+_STOPPED_WITH_ERROR_STATE = ServiceState.STOPPED_WITH_ERROR.value
+_HEALTHY_HEALTH = SystemHealth.HEALTHY.value
+_DEGRADED_HEALTH = SystemHealth.DEGRADED.value
+_CRITICAL_HEALTH = SystemHealth.CRITICAL.value
+
+
+# ======================================================================
+# Fixtures
+# ======================================================================
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make recovery delays instant; returns the list of requested delays."""
+    delays = []
+
+    async def _async_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+
+    monkeypatch.setattr(time, "sleep", delays.append)
+    monkeypatch.setattr(asyncio, "sleep", _async_sleep)
+    return delays
+
+
+@pytest.fixture
+def detector():
+    """A fresh FaultDetector; its failure history is per test."""
+    return FaultDetector()
+
+
+@pytest.fixture
+def running_monitor():
+    """A ServiceMonitor with one started StableService named "svc"."""
+    monitor = ServiceMonitor()
+    service = StableService("svc")
+    monitor.register_service(service)
+    monitor.start_service("svc")
+    return monitor, service
+
+
+@pytest.fixture(scope="module")
+def _running_template():
+    service = StableService("s")
+    service.start()
+    return service
+
+
+@pytest.fixture
+def running_service(_running_template):
+    """A started StableService, copied from a template started once per module."""
+    clone = copy.copy(_running_template)
+    # copy.copy() shares these with the template; give the clone its own.
+    clone.metadata = dict(_running_template.metadata)
+    clone._state_listeners = []
+    return clone
+
+
+class _FastStub(ManagedService):
+    """Deterministic service: raises each queued error in turn, then returns "ok"."""
+
+    __slots__ = ("failures",)
+
+    def __init__(self, name: str = "stub", failures=()):
+        super().__init__(name)
+        self.failures = list(failures)
+
+    def start(self):
+        self.set_state(ServiceState.RUNNING)
+
+    def stop(self):
+        self.set_state(ServiceState.STOPPED)
+
+    def execute(self):
+        if self.failures:
+            raise self.failures.pop(0)
+        return "ok"
 
 
 # ======================================================================
@@ -54,6 +150,10 @@ class TestErrorClassification:
         error = TransientError("boom")
         assert "TRANSIENT" in str(error)
 
+    def test_severity_is_interchangeable_with_its_value(self):
+        assert ErrorSeverity.TRANSIENT == "transient"
+        assert f"{ErrorSeverity.CRITICAL}" == "critical"
+
 
 # ======================================================================
 # Fault Detection
@@ -62,71 +162,88 @@ class TestErrorClassification:
 class TestFaultDetector:
     """Tests for FaultDetector classification and pattern logic."""
 
-    def test_classify_network_timeout_as_transient(self):
-        detector = FaultDetector()
-        severity = detector.classify_error(NetworkTimeoutError("timeout"), "svc")
-        assert severity == ErrorSeverity.TRANSIENT
-
-    def test_classify_state_corruption_as_recoverable(self):
-        detector = FaultDetector()
-        severity = detector.classify_error(StateCorruptionError("corrupted"), "svc")
-        assert severity == ErrorSeverity.RECOVERABLE
-
-    def test_classify_critical_error(self):
-        detector = FaultDetector()
-        severity = detector.classify_error(CriticalError("fatal"), "svc")
-        assert severity == ErrorSeverity.CRITICAL
-
-    def test_classify_builtin_timeout_as_transient(self):
-        detector = FaultDetector()
-        assert detector.classify_error(TimeoutError("to"), "svc") == ErrorSeverity.TRANSIENT
-
-    def test_classify_value_error_as_recoverable(self):
-        detector = FaultDetector()
-        assert detector.classify_error(ValueError("bad"), "svc") == ErrorSeverity.RECOVERABLE
-
-    def test_failure_count_tracking(self):
-        detector = FaultDetector()
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (NetworkTimeoutError("timeout"), ErrorSeverity.TRANSIENT),
+            (StateCorruptionError("corrupted"), ErrorSeverity.RECOVERABLE),
+            (CriticalError("fatal"), ErrorSeverity.CRITICAL),
+            (TimeoutError("to"), ErrorSeverity.TRANSIENT),
+            (ValueError("bad"), ErrorSeverity.RECOVERABLE),
+            # Unlisted classes resolve through their nearest mapped base.
+            (ConnectionRefusedError(), ErrorSeverity.TRANSIENT),
+            (RuntimeError("?"), ErrorSeverity.RECOVERABLE),
+        ],
+        ids=lambda value: type(value).__name__ if isinstance(value, Exception) else None,
+    )
+    def test_classify(self, detector, error, expected):
+        assert detector.classify_error(error, "svc") == expected
+
+    def test_failure_count_tracking(self, detector):
         for _ in range(5):
             detector.classify_error(TransientError("e"), "svc1")
         assert detector.get_failure_count("svc1") == 5
         assert detector.get_failure_count("svc2") == 0
 
-    def test_severity_escalation_transient_to_recoverable(self):
-        detector = FaultDetector()
+    def test_severity_escalation_transient_to_recoverable(self, detector):
         for _ in range(6):
             detector.classify_error(TransientError("repeated"), "svc")
         # 7th error should be escalated
         severity = detector.classify_error(TransientError("still failing"), "svc")
         assert severity == ErrorSeverity.RECOVERABLE
 
-    def test_clear_history(self):
-        detector = FaultDetector()
+    def test_clear_history(self, detector):
         detector.classify_error(TransientError("e"), "svc")
         assert detector.get_failure_count("svc") == 1
         detector.clear_history("svc")
         assert detector.get_failure_count("svc") == 0
 
-    def test_clear_history_does_not_affect_other_services(self):
-        detector = FaultDetector()
+    def test_clear_history_does_not_affect_other_services(self, detector):
         detector.classify_error(TransientError("e"), "svc1")
         detector.classify_error(TransientError("e"), "svc2")
         detector.clear_history("svc1")
         assert detector.get_failure_count("svc1") == 0
         assert detector.get_failure_count("svc2") == 1
 
+    def test_history_bounded_by_max_history(self, detector):
+        for _ in range(detector.max_history + 20):
+            detector.classify_error(TransientError("e"), "svc")
+        assert len(detector.error_history) == detector.max_history
+
+    def test_failure_count_follows_sliding_window(self, detector):
+        for _ in range(10):
+            detector.classify_error(TransientError("e"), "svc1")
+        for _ in range(10):
+            detector.classify_error(TransientError("e"), "svc2")
+        assert detector.get_failure_count("svc1") == 0
+        assert detector.get_failure_count("svc1", window=detector.max_history) == 10
+        assert detector.get_failure_count("svc2", window=15) == 10
+
+        detector.clear_history("svc2")
+        assert detector.get_failure_count("svc1") == 10
+
+    def test_classify_batch_matches_sequential_classification(self):
+        errors = [("svc", TransientError("e")) for _ in range(7)]
+        errors += [("other", ValueError("bad")), ("svc", CriticalError("c"))]
+
+        sequential = FaultDetector()
+        expected = [sequential.classify_error(e, name) for name, e in errors]
+
+        batched = FaultDetector()
+        assert batched.classify_batch(errors) == expected
+        assert batched.get_failure_count("svc") == sequential.get_failure_count("svc")
+
 
 # ======================================================================
 # Recovery Strategies
 # ======================================================================
 
+@pytest.mark.usefixtures("no_sleep")
 class TestRetryStrategy:
     """Tests for RetryStrategy."""
 
-    def test_succeeds_on_third_attempt(self):
+    def test_succeeds_on_third_attempt(self, no_sleep, running_service):
         strategy = RetryStrategy(max_attempts=3, base_delay=0.01)
-        service = StableService("s")
-        service.start()
 
         attempts = [0]
 
@@ -135,91 +252,112 @@ class TestRetryStrategy:
             if attempts[0] < 3:
                 raise TransientError("not yet")
 
-        assert strategy.recover(service, TransientError("t"), op) is True
+        assert strategy.recover(running_service, TransientError("t"), op) is True
         assert attempts[0] == 3
+        assert no_sleep == [0.01, 0.02]
 
-    def test_returns_false_when_all_attempts_fail(self):
+    def test_returns_false_when_all_attempts_fail(self, running_service):
         strategy = RetryStrategy(max_attempts=3, base_delay=0.01)
-        service = StableService("s")
-        service.start()
 
         def always_fail():
             raise TransientError("always")
 
-        assert strategy.recover(service, TransientError("t"), always_fail) is False
+        assert strategy.recover(running_service, TransientError("t"), always_fail) is False
 
-    def test_returns_false_without_operation(self):
+    def test_returns_false_without_operation(self, running_service):
         strategy = RetryStrategy()
-        service = StableService("s")
-        service.start()
-        assert strategy.recover(service, TransientError("t"), None) is False
+        assert strategy.recover(running_service, TransientError("t"), None) is False
+
+    def test_disabled_warnings_skip_error_formatting(self):
+        rendered = []
 
+        class Noisy(TransientError):
+            def __str__(self):
+                rendered.append(self)
+                return "noisy"
 
+        def always_fail():
+            raise Noisy("x")
+
+        strategy = RetryStrategy(max_attempts=2, base_delay=0.0)
+        recovery_logger = logging.getLogger("core.recovery")
+        previous = recovery_logger.level
+        recovery_logger.setLevel(logging.ERROR)
+        try:
+            assert strategy.recover(StableService("s"), Noisy("x"), always_fail) is False
+        finally:
+            recovery_logger.setLevel(previous)
+        assert rendered == []
+
+    def test_arecover_awaits_async_operation(self, running_service):
+        strategy = RetryStrategy(max_attempts=3, base_delay=0.01)
+
+        attempts = [0]
+
+        async def op():
+            attempts[0] += 1
+            if attempts[0] < 2:
+                raise TransientError("not yet")
+
+        assert asyncio.run(strategy.arecover(running_service, TransientError("t"), op)) is True
+        assert attempts[0] == 2
+
+
+@pytest.mark.usefixtures("no_sleep")
 class TestRestartStrategy:
     """Tests for RestartStrategy."""
 
-    def test_service_running_after_restart(self):
+    def test_service_running_after_restart(self, running_service):
         strategy = RestartStrategy(cleanup_state=True, restart_delay=0.01)
-        service = StableService("s")
-        service.start()
 
-        assert strategy.recover(service, RecoverableError("r")) is True
-        assert service.get_state() == ServiceState.RUNNING
+        assert strategy.recover(running_service, RecoverableError("r")) is True
+        assert running_service.get_state() == ServiceState.RUNNING
 
-    def test_metadata_cleared_when_cleanup_true(self):
+    def test_metadata_cleared_when_cleanup_true(self, running_service):
         strategy = RestartStrategy(cleanup_state=True, restart_delay=0.01)
-        service = StableService("s")
-        service.start()
-        service.metadata["sentinel"] = "present"
+        running_service.metadata["sentinel"] = "present"
 
-        strategy.recover(service, RecoverableError("r"))
-        assert "sentinel" not in service.metadata
+        strategy.recover(running_service, RecoverableError("r"))
+        assert "sentinel" not in running_service.metadata
 
-    def test_metadata_preserved_when_cleanup_false(self):
+    def test_metadata_preserved_when_cleanup_false(self, running_service):
         strategy = RestartStrategy(cleanup_state=False, restart_delay=0.01)
-        service = StableService("s")
-        service.start()
-        service.metadata["sentinel"] = "present"
+        running_service.metadata["sentinel"] = "present"
 
-        strategy.recover(service, RecoverableError("r"))
+        strategy.recover(running_service, RecoverableError("r"))
         # metadata is cleared by stop(), then start() adds started_at;
         # without cleanup the framework preserves user keys added *before* stop.
         # Because StableService.stop() doesn't touch metadata beyond setting state,
         # the sentinel should still be there.
-        assert service.metadata.get("sentinel") == "present"
+        assert running_service.metadata.get("sentinel") == "present"
 
 
 class TestFallbackStrategy:
     """Tests for FallbackStrategy."""
 
-    def test_service_set_to_degraded(self):
+    def test_service_set_to_degraded(self, running_service):
         strategy = FallbackStrategy()
-        service = StableService("s")
-        service.start()
 
-        assert strategy.recover(service, CriticalError("c")) is True
-        assert service.get_state() == ServiceState.DEGRADED
+        assert strategy.recover(running_service, CriticalError("c")) is True
+        assert running_service.get_state() == ServiceState.DEGRADED
 
-    def test_fallback_hook_called(self):
+    def test_fallback_hook_called(self, running_service):
         called = [False]
 
         def hook(svc):
             called[0] = True
 
         strategy = FallbackStrategy(fallback_hook=hook)
-        service = StableService("s")
-        service.start()
-        strategy.recover(service, CriticalError("c"))
+        strategy.recover(running_service, CriticalError("c"))
         assert called[0] is True
 
 
+@pytest.mark.slow
 class TestRecoveryOrchestrator:
     """Tests for RecoveryOrchestrator decision logic."""
 
-    def test_transient_error_retries_then_succeeds(self):
+    def test_transient_error_retries_then_succeeds(self, running_service):
         orchestrator = RecoveryOrchestrator()
-        service = StableService("s")
-        service.start()
 
         attempts = [0]
 
@@ -228,26 +366,57 @@ class TestRecoveryOrchestrator:
             if attempts[0] == 1:
                 raise TransientError("once")
 
-        assert orchestrator.recover(service, TransientError("t"), ErrorSeverity.TRANSIENT, op) is True
+        assert orchestrator.recover(running_service, TransientError("t"), ErrorSeverity.TRANSIENT, op) is True
 
-    def test_recoverable_error_restarts_service(self):
+    def test_recoverable_error_restarts_service(self, running_service):
         orchestrator = RecoveryOrchestrator()
-        service = StableService("s")
-        service.start()
 
-        result = orchestrator.recover(service, RecoverableError("r"), ErrorSeverity.RECOVERABLE)
+        result = orchestrator.recover(running_service, RecoverableError("r"), ErrorSeverity.RECOVERABLE)
         assert result is True
-        assert service.get_state() == ServiceState.RUNNING
+        assert running_service.get_state() == ServiceState.RUNNING
 
-    def test_critical_error_falls_back(self):
+    def test_critical_error_falls_back(self, running_service):
         orchestrator = RecoveryOrchestrator()
-        service = StableService("s")
-        service.start()
 
-        result = orchestrator.recover(service, CriticalError("c"), ErrorSeverity.CRITICAL)
+        result = orchestrator.recover(running_service, CriticalError("c"), ErrorSeverity.CRITICAL)
+        assert result is True
+        assert running_service.get_state() == ServiceState.DEGRADED
+
+    def test_failed_restart_escalates_to_fallback(self):
+        class Unstartable(StableService):
+            def start(self):
+                raise RuntimeError("cannot start")
+
+        orchestrator = RecoveryOrchestrator()
+        orchestrator.restart_strategy.restart_delay = 0.01
+        service = Unstartable("s")
+
+        result = orchestrator.recover(service, RecoverableError("r"), ErrorSeverity.RECOVERABLE)
         assert result is True
         assert service.get_state() == ServiceState.DEGRADED
 
+    def test_reassigned_strategy_is_used(self, running_service):
+        calls = []
+
+        class RecordingStrategy(RetryStrategy):
+            def recover(self, service, error, operation=None):
+                calls.append(service.name)
+                return True
+
+        orchestrator = RecoveryOrchestrator()
+        orchestrator.retry_strategy = RecordingStrategy()
+
+        assert orchestrator.recover(running_service, TransientError("t"), ErrorSeverity.TRANSIENT) is True
+        assert calls == [running_service.name]
+
+    def test_arecover_restarts_service(self, running_service):
+        orchestrator = RecoveryOrchestrator()
+        orchestrator.restart_strategy.restart_delay = 0.01
+
+        coro = orchestrator.arecover(running_service, RecoverableError("r"), ErrorSeverity.RECOVERABLE)
+        assert asyncio.run(coro) is True
+        assert running_service.get_state() == ServiceState.RUNNING
+
 
 # ======================================================================
 # Service Monitor
@@ -273,50 +442,137 @@ class TestServiceMonitor:
         monitor = ServiceMonitor()
         assert monitor.start_service("ghost") is False
 
-    def test_execute_returns_result(self):
-        monitor = ServiceMonitor()
-        service = StableService("svc")
-        monitor.register_service(service)
-        monitor.start_service("svc")
+    def test_execute_returns_result(self, running_monitor):
+        monitor, _ = running_monitor
 
         result = monitor.execute_with_monitoring("svc")
         assert result is not None
         assert "successfully" in result
 
+    def test_execute_async_returns_result(self, running_monitor):
+        monitor, _ = running_monitor
+
+        result = asyncio.run(monitor.execute_with_monitoring_async("svc"))
+        assert "successfully" in result
+
     def test_execute_unknown_service_returns_none(self):
         monitor = ServiceMonitor()
         assert monitor.execute_with_monitoring("ghost") is None
 
     def test_recovery_on_transient_failure(self):
         monitor = ServiceMonitor()
-        # failure_rate=0 → always succeeds after first call in recovery
-        service = TransientFailureService("svc", failure_rate=0.0)
+        service = _FastStub("svc", failures=[NetworkTimeoutError("blip")])
         monitor.register_service(service)
         monitor.start_service("svc")
 
-        result = monitor.execute_with_monitoring("svc")
-        assert result is not None
+        assert monitor.execute_with_monitoring("svc") == "ok"
+        assert monitor.detector.get_failure_count("svc") == 1
 
-    def test_get_service_status(self):
+    def test_unrecovered_critical_failure_gives_up_immediately(self):
         monitor = ServiceMonitor()
-        service = StableService("svc")
+
+        def broken_hook(svc):
+            raise RuntimeError("fallback unavailable")
+
+        monitor.recovery.fallback_strategy.fallback_hook = broken_hook
+        service = CriticalFailureService("svc", failure_at=1)
+        monitor.register_service(service)
+        monitor.start_service("svc")
+
+        assert monitor.execute_with_monitoring("svc") is None
+        assert service.get_state() == ServiceState.STOPPED_WITH_ERROR
+        assert monitor.detector.get_failure_count("svc") == 1
+
+    def test_async_execution_backs_off_after_recovered_failure(self, no_sleep):
+        monitor = ServiceMonitor()
+        monitor.register_service(_FastStub("svc", failures=[TransientError("once")]))
+        monitor.start_service("svc")
+
+        assert asyncio.run(monitor.execute_with_monitoring_async("svc")) == "ok"
+        assert no_sleep == [0.05]
+
+    def test_async_unrecovered_critical_failure_gives_up_immediately(self, no_sleep):
+        monitor = ServiceMonitor()
+
+        def broken_hook(svc):
+            raise RuntimeError("fallback unavailable")
+
+        monitor.recovery.fallback_strategy.fallback_hook = broken_hook
+        service = CriticalFailureService("svc", failure_at=1)
         monitor.register_service(service)
         monitor.start_service("svc")
 
+        assert asyncio.run(monitor.execute_with_monitoring_async("svc")) is None
+        assert service.get_state() == ServiceState.STOPPED_WITH_ERROR
+        assert monitor.detector.get_failure_count("svc") == 1
+        assert no_sleep == []
+
+    def test_get_service_status(self, running_monitor):
+        monitor, _ = running_monitor
+
         status = monitor.get_service_status("svc")
         assert status["name"] == "svc"
         assert status["state"] == ServiceState.RUNNING.value
+        assert status["state"] is ServiceState.RUNNING
         assert status["healthy"] is True
 
     def test_get_all_service_status(self):
         monitor = ServiceMonitor()
-        for i in range(3):
-            svc = StableService(f"svc{i}")
-            monitor.register_service(svc)
-            monitor.start_service(f"svc{i}")
+        monitor.register_services(StableService(f"svc{i}") for i in range(3))
 
         statuses = monitor.get_all_service_status()
         assert len(statuses) == 3
+        assert all(status["state"] is ServiceState.RUNNING for status in statuses.values())
+
+    def test_status_cached_until_state_changes(self, running_monitor):
+        monitor, _ = running_monitor
+
+        status = monitor.get_service_status("svc")
+        status["healthy"] = False
+        assert monitor.get_service_status("svc")["healthy"] is True
+
+        monitor.stop_service("svc")
+        assert monitor.get_service_status("svc")["state"] is ServiceState.STOPPED
+
+    def test_status_metadata_is_current_and_serializable(self, running_monitor):
+        monitor, service = running_monitor
+        monitor.get_service_status("svc")
+
+        service.metadata = {"region": "eu"}
+        status = monitor.get_service_status("svc")
+        assert status["metadata"] == {"region": "eu"}
+        assert json.loads(json.dumps(status))["state"] == _RUNNING_STATE
+
+    def test_status_for_service_added_directly(self):
+        monitor = ServiceMonitor()
+        service = StableService("svc")
+        monitor.services["svc"] = service
+        assert monitor.get_service_status("svc")["state"] is ServiceState.STOPPED
+
+        service.start()
+        assert monitor.get_service_status("svc")["state"] is ServiceState.RUNNING
+
+    def test_failure_invalidates_only_affected_statuses(self):
+        monitor = ServiceMonitor()
+        monitor.register_services(_FastStub(f"svc{i}") for i in range(4))
+        for i in range(monitor.detector.pattern_window):
+            monitor._record_failure(f"svc{i % 2}", TransientError("e"), 1)
+        monitor.get_all_service_status()
+
+        # The window is full, so this pushes out svc0's oldest failure.
+        monitor._record_failure("svc2", TransientError("e"), 1)
+        assert monitor._status_dirty == {"svc0", "svc2"}
+        assert monitor.get_service_status("svc0")["recent_failures"] == 4
+        assert monitor.get_service_status("svc2")["recent_failures"] == 1
+
+    def test_status_refreshed_after_failure(self):
+        monitor = ServiceMonitor()
+        monitor.register_service(CriticalFailureService("svc", failure_at=1))
+        monitor.start_service("svc")
+        assert monitor.get_service_status("svc")["recent_failures"] == 0
+
+        monitor.execute_with_monitoring("svc", max_failures=1)
+        assert monitor.get_service_status("svc")["recent_failures"] == 1
 
     def test_unregister_service(self):
         monitor = ServiceMonitor()
@@ -325,14 +581,69 @@ class TestServiceMonitor:
         monitor.unregister_service("svc")
         assert "svc" not in monitor.services
 
-    def test_stop_service(self):
+    def test_unregister_keeps_service_when_stop_fails(self):
+        class Unstoppable(_FastStub):
+            __slots__ = ()
+
+            def stop(self):
+                raise RuntimeError("cannot stop")
+
         monitor = ServiceMonitor()
-        service = StableService("svc")
-        monitor.register_service(service)
-        monitor.start_service("svc")
+        monitor.register_service(Unstoppable("svc"))
+
+        with pytest.raises(RuntimeError, match="cannot stop"):
+            monitor.unregister_service("svc")
+        assert "svc" in monitor.services
+
+    def test_stop_service(self, running_monitor):
+        monitor, service = running_monitor
         monitor.stop_service("svc")
         assert service.get_state() == ServiceState.STOPPED
 
+    @pytest.mark.slow
+    def test_monitor_loop_runs_for_duration(self, running_monitor):
+        monitor, service = running_monitor
+
+        for _ in range(2):  # a second session must work on a fresh event loop
+            asyncio.run(monitor.monitor_loop("svc", interval=0.01, duration=0.05))
+        assert service.execution_count >= 2
+
+    def test_stop_monitoring_wakes_monitor_loop(self, running_monitor):
+        monitor, service = running_monitor
+
+        async def scenario():
+            task = asyncio.create_task(monitor.monitor_loop("svc", interval=60.0))
+            await asyncio.sleep(0.01)
+            monitor.stop_monitoring()
+            await asyncio.wait_for(task, timeout=1.0)
+
+        asyncio.run(scenario())
+        assert service.execution_count == 1
+
+    @pytest.mark.slow
+    def test_monitor_all_runs_every_service(self):
+        monitor = ServiceMonitor()
+        services = [StableService(f"svc{i}") for i in range(3)]
+        monitor.register_services(services)
+
+        asyncio.run(monitor.monitor_all(interval=0.01, duration=0.05))
+        assert all(svc.execution_count >= 1 for svc in services)
+
+    @pytest.mark.slow
+    def test_monitor_all_with_worker_pool(self):
+        monitor = ServiceMonitor()
+        services = [StableService(f"svc{i}") for i in range(5)]
+        monitor.register_services(services)
+
+        asyncio.run(monitor.monitor_all(interval=0.01, duration=0.1, workers=2))
+        assert all(svc.execution_count >= 2 for svc in services)
+
+    def test_monitor_all_rejects_empty_worker_pool(self, running_monitor):
+        monitor, _ = running_monitor
+
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            asyncio.run(monitor.monitor_all(workers=0))
+
 
 # ======================================================================
 # Health Reporter
@@ -341,46 +652,58 @@ class TestServiceMonitor:
 class TestHealthReporter:
     """Tests for HealthReporter report generation."""
 
-    def _running_status(self, **kwargs):
-        base = {"state": ServiceState.RUNNING.value, "healthy": True, "recent_failures": 0}
-        base.update(kwargs)
-        return base
+    # Read-only so a test cannot leak changes into the next one.
+    _HEALTHY_STATUS = MappingProxyType(
+        {"state": _RUNNING_STATE, "healthy": True, "recent_failures": 0}
+    )
+    _DEGRADED_STATUS = MappingProxyType(
+        {"state": _DEGRADED_STATE, "healthy": True, "recent_failures": 2}
+    )
 
-    def test_all_healthy(self):
-        reporter = HealthReporter()
-        statuses = {
-            "s1": self._running_status(),
-            "s2": self._running_status(),
-        }
-        report = reporter.generate_report(statuses)
-        assert report["system_health"] == SystemHealth.HEALTHY.value
-        assert report["summary"]["health_percentage"] == 100.0
-
-    def test_degraded_service_makes_system_degraded(self):
-        reporter = HealthReporter()
-        statuses = {
-            "s1": self._running_status(),
-            "s2": {"state": ServiceState.DEGRADED.value, "healthy": True, "recent_failures": 2},
-        }
-        report = reporter.generate_report(statuses)
-        assert report["system_health"] == SystemHealth.DEGRADED.value
-        assert report["summary"]["degraded"] == 1
+    def _running_status(self, **kwargs):
+        return {**self._HEALTHY_STATUS, **kwargs}
+
+    @pytest.mark.parametrize(
+        "statuses, expected_health, expected_summary",
+        [
+            pytest.param(
+                {"s1": _HEALTHY_STATUS, "s2": _HEALTHY_STATUS},
+                _HEALTHY_HEALTH,
+                {"health_percentage": 100.0},
+                id="all-healthy",
+            ),
+            pytest.param(
+                {"s1": _HEALTHY_STATUS, "s2": _DEGRADED_STATUS},
+                _DEGRADED_HEALTH,
+                {"degraded": 1},
+                id="one-degraded",
+            ),
+            pytest.param(
+                {},
+                _HEALTHY_HEALTH,
+                {"total_services": 0},
+                id="empty",
+            ),
+        ],
+    )
+    def test_system_health(self, statuses, expected_health, expected_summary):
+        report = HealthReporter().generate_report(statuses)
+        assert report["system_health"] == expected_health
+        assert {key: report["summary"][key] for key in expected_summary} == expected_summary
 
     def test_failed_service_makes_system_critical(self):
         reporter = HealthReporter()
         statuses = {
-            "s1": {"state": ServiceState.STOPPING_WITH_ERROR if hasattr(ServiceState, 'STOPPING_WITH_ERROR') else ServiceState.STOPPED_WITH_ERROR.value, "healthy": False, "recent_failures": 10},
+            "s1": {"state": _STOPPED_WITH_ERROR_STATE, "healthy": False, "recent_failures": 10},
         }
-        # Ensure the state value is the raw string
-        statuses["s1"]["state"] = ServiceState.STOPPED_WITH_ERROR.value
         report = reporter.generate_report(statuses)
-        assert report["system_health"] == SystemHealth.CRITICAL.value
+        assert report["system_health"] == _CRITICAL_HEALTH
 
     def test_critical_alert_generated_for_failed_service(self):
         reporter = HealthReporter()
         statuses = {
             "bad": {
-                "state": ServiceState.STOPPED_WITH_ERROR.value,
+                "state": _STOPPED_WITH_ERROR_STATE,
                 "healthy": False,
                 "recent_failures": 8,
             }
@@ -398,15 +721,9 @@ class TestHealthReporter:
         warning_alerts = [a for a in report["alerts"] if a["severity"] == "warning"]
         assert len(warning_alerts) >= 1
 
-    def test_empty_system_is_healthy(self):
-        reporter = HealthReporter()
-        report = reporter.generate_report({})
-        assert report["system_health"] == SystemHealth.HEALTHY.value
-        assert report["summary"]["total_services"] == 0
-
     def test_format_report_text_contains_key_fields(self):
         reporter = HealthReporter()
-        statuses = {"s1": self._running_status()}
+        statuses = {"s1": self._HEALTHY_STATUS}
         report = reporter.generate_report(statuses)
         text = reporter.format_report_text(report)
 
@@ -415,6 +732,41 @@ class TestHealthReporter:
         assert "SUMMARY" in text
         assert "SERVICES" in text
 
+    def test_streamed_report_text_matches_list_rendering(self):
+        reporter = HealthReporter()
+        statuses = {
+            "s1": self._HEALTHY_STATUS,
+            "s2": self._running_status(state=_DEGRADED_STATE, recent_failures=6),
+        }
+        report = reporter.generate_report(statuses)
+        expected = reporter.format_report_text(report)
+
+        streaming = HealthReporter(stream_threshold=0)
+        assert streaming.format_report_text(report) == expected
+
+
+# ======================================================================
+# Structured Logger
+# ======================================================================
+
+class TestStructuredLogger:
+    """Tests for StructuredLogger metadata rendering."""
+
+    @pytest.mark.parametrize(
+        "metadata, rendered",
+        [
+            ({"a": 1, "b": "x"}, '{"a":1,"b":"x"}'),
+            ({"n": 2 ** 70}, '{"n":%d}' % 2 ** 70),
+            ({1: True}, '{"1":true}'),
+        ],
+        ids=["compact", "big-int", "non-str-key"],
+    )
+    def test_metadata_rendered_as_compact_json(self, caplog, metadata, rendered):
+        logger = get_logger("tests.structured")
+        with caplog.at_level(logging.INFO, logger="tests.structured"):
+            logger.info("event", metadata=metadata)
+        assert caplog.records[-1].getMessage() == f"event | Metadata: {rendered}"
+
 
 # ======================================================================
 # Sample Services
@@ -435,39 +787,96 @@ class TestSampleServices:
         svc.stop()
         assert svc.get_state() == ServiceState.STOPPED
 
-    def test_transient_service_raises_on_guaranteed_failure(self):
-        svc = TransientFailureService("t", failure_rate=1.0)
+    @pytest.mark.parametrize(
+        "failure_rate, outcome, counts",
+        [
+            pytest.param(
+                1.0,
+                pytest.raises(NetworkTimeoutError, match=r"execution #1\b"),
+                (0, 1),
+                id="always-fails",
+            ),
+            pytest.param(0.0, nullcontext(), (1, 0), id="never-fails"),
+        ],
+    )
+    def test_transient_service_execution(self, failure_rate, outcome, counts):
+        svc = TransientFailureService("t", failure_rate=failure_rate)
         svc.start()
-        with pytest.raises(NetworkTimeoutError):
+        with outcome:
             svc.execute()
-        assert svc.failed_count == 1
-
-    def test_transient_service_succeeds_on_zero_failure_rate(self):
-        svc = TransientFailureService("t", failure_rate=0.0)
+        assert (svc.successful_count, svc.failed_count) == counts
+
+    def test_intermittent_service_outcomes_follow_seed(self):
+        def outcomes(svc):
+            svc.start()
+            seen = []
+            for _ in range(50):
+                try:
+                    svc.execute()
+                    seen.append(None)
+                except Exception as exc:
+                    seen.append(type(exc))
+            return seen
+
+        first = outcomes(IntermittentService("a", seed=7))
+        assert first == outcomes(IntermittentService("b", seed=7))
+        assert None in first
+
+    def test_intermittent_service_honours_subclass_probabilities(self):
+        class AlwaysTransient(IntermittentService):
+            __slots__ = ()
+            TRANSIENT_PROB = 1.0
+            RECOVERABLE_PROB = 0.0
+            CRITICAL_PROB = 0.0
+
+        svc = AlwaysTransient("t", seed=7)
         svc.start()
-        result = svc.execute()
-        assert result is not None
-        assert svc.successful_count == 1
-
-    def test_health_check_running_is_healthy(self):
-        svc = StableService("t")
-        svc.set_state(ServiceState.RUNNING)
-        assert svc.health_check() is True
-
-    def test_health_check_degraded_is_healthy(self):
+        for _ in range(20):
+            with pytest.raises(NetworkTimeoutError):
+                svc.execute()
+
+    @pytest.mark.parametrize(
+        "state, healthy",
+        [
+            (ServiceState.RUNNING, True),
+            (ServiceState.DEGRADED, True),
+            (ServiceState.STOPPED, False),
+            (ServiceState.STOPPED_WITH_ERROR, False),
+        ],
+        ids=str,
+    )
+    def test_health_check(self, state, healthy):
         svc = StableService("t")
-        svc.set_state(ServiceState.DEGRADED)
-        assert svc.health_check() is True
+        svc.set_state(state)
+        assert svc.health_check() is healthy
 
-    def test_health_check_stopped_is_unhealthy(self):
+    def test_metadata_view_is_read_only_and_live(self):
         svc = StableService("t")
-        svc.set_state(ServiceState.STOPPED)
-        assert svc.health_check() is False
-
-    def test_health_check_failed_is_unhealthy(self):
+        view = svc.get_metadata()
+        svc.start()
+        assert "started_at" in view
+        assert svc.get_metadata() is view
+        with pytest.raises(TypeError, match="does not support item assignment"):
+            view["x"] = 1
+
+    def test_running_service_is_independent_of_template(
+        self, _running_template, running_service
+    ):
+        listener_calls = []
+        _running_template.add_state_listener(listener_calls.append)
+        try:
+            running_service.metadata["only"] = "clone"
+            running_service.stop()
+        finally:
+            _running_template.remove_state_listener(listener_calls.append)
+        assert "only" not in _running_template.get_metadata()
+        assert _running_template.get_state() is ServiceState.RUNNING
+        assert listener_calls == []
+
+    def test_state_assignment_stores_enum_member(self):
         svc = StableService("t")
-        svc.set_state(ServiceState.STOPPED_WITH_ERROR)
-        assert svc.health_check() is False
+        svc.state = "degraded"
+        assert svc.get_state() is ServiceState.DEGRADED
 
 
 if __name__ == "__main__":